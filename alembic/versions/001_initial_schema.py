@@ -18,6 +18,14 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade() -> None:
     """Create initial schema with users, posts, and comments tables."""
+    # Enable WAL mode for better concurrency (cannot be changed inside a transaction)
+    op.execute("PRAGMA journal_mode=WAL")
+    op.execute("PRAGMA foreign_keys=ON")
+
+    # Create the whole schema in one transaction: SQLite otherwise autocommits
+    # (and fsyncs) every DDL statement separately
+    op.execute("BEGIN")
+
     # Users table
     op.execute(
         """
@@ -81,9 +89,7 @@ def upgrade() -> None:
         "CREATE INDEX IF NOT EXISTS idx_comments_created_at ON comments(created_at)"
     )
 
-    # Enable WAL mode for better concurrency
-    op.execute("PRAGMA journal_mode=WAL")
-    op.execute("PRAGMA foreign_keys=ON")
+    op.execute("COMMIT")
 
 
 def downgrade() -> None:
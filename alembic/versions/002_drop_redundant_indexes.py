@@ -0,0 +1,47 @@
+"""Drop redundant single-column indexes.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: str | None = "001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Drop indexes already covered by a composite index prefix or UNIQUE constraint."""
+    op.execute("BEGIN")
+
+    # Covered by idx_posts_author_created (author_id, created_at)
+    op.execute("DROP INDEX IF EXISTS idx_posts_author_id")
+    # Covered by idx_comments_post_created (post_id, created_at)
+    op.execute("DROP INDEX IF EXISTS idx_comments_post_id")
+    # Covered by the automatic indexes of the UNIQUE username/email columns
+    op.execute("DROP INDEX IF EXISTS idx_users_username")
+    op.execute("DROP INDEX IF EXISTS idx_users_email")
+
+    op.execute("COMMIT")
+
+    # Refresh planner statistics so the remaining indexes are chosen
+    op.execute("ANALYZE")
+
+
+def downgrade() -> None:
+    """Recreate the single-column indexes."""
+    op.execute("BEGIN")
+
+    op.execute("CREATE INDEX IF NOT EXISTS idx_users_username ON users(username)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_users_email ON users(email)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_posts_author_id ON posts(author_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_comments_post_id ON comments(post_id)")
+
+    op.execute("COMMIT")
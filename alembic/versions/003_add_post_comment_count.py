@@ -0,0 +1,38 @@
+"""Add denormalized comment count to posts.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add posts.comment_count and backfill it from existing comments."""
+    op.execute("BEGIN")
+
+    op.execute("ALTER TABLE posts ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0")
+    op.execute(
+        """
+        UPDATE posts SET comment_count = (
+            SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.id
+        )
+        """
+    )
+
+    op.execute("COMMIT")
+
+
+def downgrade() -> None:
+    """Drop posts.comment_count."""
+    op.execute("ALTER TABLE posts DROP COLUMN comment_count")
@@ -4,8 +4,26 @@ Configuration management for the blog application.
 Uses Pydantic Settings for environment variable loading and validation.
 """
 
+from functools import lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from tortoise.backends.base.config_generator import expand_db_url
+
+# Tortoise model modules registered with the application
+MODEL_MODULES = ["app.models.user", "app.models.post", "app.models.comment"]
+
+# Per-connection SQLite PRAGMAs. Tortoise's SQLite client runs every extra
+# credential as ``PRAGMA key=value`` when it opens a connection, so these apply
+# to each new aiosqlite connection (journal_mode=WAL is persistent and set by
+# the initial migration).
+SQLITE_PRAGMAS = {
+    "synchronous": "NORMAL",  # fsync on checkpoint only, safe with WAL
+    "temp_store": "MEMORY",  # temp B-trees for sorts/joins stay in RAM
+    "mmap_size": 268435456,  # 256MB memory-mapped reads
+    "cache_size": -64000,  # ~64MB page cache (negative value = KiB)
+    "foreign_keys": "ON",
+}
 
 
 class Settings(BaseSettings):
@@ -19,12 +37,22 @@ class Settings(BaseSettings):
     jwt_algorithm: str = Field(default="HS256")
     jwt_expire_minutes: int = Field(default=1440)
 
-    # Password Hashing
-    bcrypt_rounds: int = Field(default=12)
+    # Password Hashing (argon2id)
+    argon2_time_cost: int = Field(default=2)
+    argon2_memory_cost: int = Field(default=65536)  # KiB
+    argon2_parallelism: int = Field(default=2)
+    # Replaced by the argon2 settings; still accepted so existing .env files
+    # that set BCRYPT_ROUNDS keep loading, but ignored
+    bcrypt_rounds: int | None = Field(
+        default=None, deprecated="BCRYPT_ROUNDS is ignored; use the ARGON2_* settings"
+    )
 
     # Environment
     environment: str = Field(default="development")
 
+    # Logging
+    log_dir: str = Field(default="logs")
+
     # Server
     host: str = Field(default="0.0.0.0")
     port: int = Field(default=8000)
@@ -34,6 +62,45 @@ class Settings(BaseSettings):
     )
 
 
-# Global settings instance
-settings = Settings()
+def get_tortoise_config(db_url: str) -> dict:
+    """
+    Build the Tortoise ORM configuration for a database URL.
+
+    SQLite connections get the performance PRAGMAs from ``SQLITE_PRAGMAS``.
+    Tortoise's SQLite client opens a single aiosqlite connection (one worker
+    thread) per process and serializes queries on it, so there is no pool to
+    size; WAL lets other processes read while it writes.
+
+    Args:
+        db_url: Tortoise database URL
+
+    Returns:
+        Tortoise configuration dictionary
+    """
+    connection = expand_db_url(db_url)
+    if connection["engine"] == "tortoise.backends.sqlite":
+        connection["credentials"] = {**SQLITE_PRAGMAS, **connection["credentials"]}
+
+    return {
+        "connections": {"default": connection},
+        "apps": {"models": {"models": MODEL_MODULES, "default_connection": "default"}},
+    }
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Get the application settings, loading them on first use.
+
+    Usable as a FastAPI dependency (``Depends(get_settings)``), which tests
+    can override or reset with ``get_settings.cache_clear()``.
+
+    Returns:
+        Cached Settings instance
+    """
+    return Settings()
+
+
+# Global settings instance, shared with get_settings()
+settings = get_settings()
 
@@ -7,14 +7,25 @@ the current authenticated user from JWT tokens.
 
 from fastapi import Cookie, Depends, HTTPException, status
 
+from app.cache import TTLCache
 from app.models.user import User
 from app.services.auth import decode_access_token
 
+# Columns loaded for the current user; the password hash is never needed
+# outside the auth service
+CURRENT_USER_FIELDS = ("id", "username", "email", "created_at")
+
+# Recently authenticated users, keyed by user ID
+_user_cache = TTLCache(maxsize=5000, ttl=30)
+
 
 async def get_current_user(access_token: str | None = Cookie(None)) -> User:
     """
     Extract and validate current user from JWT cookie.
 
+    FastAPI caches dependency results per request, so routes and
+    sub-dependencies that all depend on this share a single call.
+
     Args:
         access_token: JWT token from HTTP-only cookie
 
@@ -38,14 +49,20 @@ async def get_current_user(access_token: str | None = Cookie(None)) -> User:
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload"
         )
 
-    # Fetch user from database
-    user = await User.filter(id=user_id).first()
+    user = _user_cache.get(user_id)
+    if user:
+        return user
+
+    # Fetch user from database (without the password hash)
+    user = await User.filter(id=user_id).only(*CURRENT_USER_FIELDS).first()
 
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
         )
 
+    _user_cache.set(user_id, user)
+
     return user
 
 
@@ -5,44 +5,67 @@ This module sets up the FastAPI application, database connections,
 middleware, and routes.
 """
 
+import atexit
 import logging
+import queue
 from contextlib import asynccontextmanager
-from logging.handlers import RotatingFileHandler
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
-from fastapi import FastAPI, Request, status
+import orjson
+from fastapi import FastAPI, Request, Response, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from tortoise.contrib.fastapi import register_tortoise
 
-from app.config import settings
+from app.config import get_tortoise_config, settings
+from app.middleware import SecurityHeadersMiddleware
 from app.routes import auth, comments, pages, posts, users
+from app.templating import templates, warm_templates
 
 # ============================================
 # LOGGING CONFIGURATION
 # ============================================
 
 # Create logs directory if it doesn't exist
-logs_dir = Path("logs")
-logs_dir.mkdir(exist_ok=True)
+logs_dir = Path(settings.log_dir)
+logs_dir.mkdir(parents=True, exist_ok=True)
+
+# Configure logging: records are put on a queue by the calling thread and
+# written to the file and stream handlers by a background listener thread, so
+# disk I/O and log rotation never run on the event loop
+log_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+log_handlers = [
+    RotatingFileHandler(
+        logs_dir / "app.log", maxBytes=10485760, backupCount=5, delay=True  # 10MB per file
+    ),
+    logging.StreamHandler(),
+]
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+
+log_queue: queue.Queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+# The queue handler only renders the message; the listener's handlers add the prefix
+queue_handler = QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter("%(message)s"))
 
-# Configure logging
 logging.basicConfig(
     level=logging.INFO if settings.environment == "production" else logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        RotatingFileHandler(
-            "logs/app.log", maxBytes=10485760, backupCount=5  # 10MB per file
-        ),
-        logging.StreamHandler(),
-    ],
+    handlers=[queue_handler],
 )
 
+# aiosqlite logs every operation at DEBUG level
+logging.getLogger("aiosqlite").setLevel(logging.INFO)
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,6 +80,9 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Starting up blog application...")
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"Database: {settings.database_url}")
+    logger.info(f"Precompiled {warm_templates()} templates")
+    render_error_page("404.html")
+    render_error_page("500.html")
     yield
     # Shutdown
     logger.info("👋 Shutting down blog application...")
@@ -68,6 +94,7 @@ app = FastAPI(
     description="A modern blog platform with user authentication, posts, and comments",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -84,47 +111,16 @@ app.add_middleware(
 # Add Gzip compression middleware
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
-
-# Security headers middleware
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next):
-    """
-    Add security headers to all responses.
-
-    Args:
-        request: FastAPI request object
-        call_next: Next middleware in chain
-
-    Returns:
-        Response with security headers
-    """
-    response = await call_next(request)
-
-    # Add security headers
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "SAMEORIGIN"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
-    # Add HSTS header in production
-    if settings.environment == "production":
-        response.headers["Strict-Transport-Security"] = (
-            "max-age=31536000; includeSubDomains"
-        )
-
-    return response
+# Add security headers middleware
+app.add_middleware(SecurityHeadersMiddleware)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
-# Configure Jinja2 templates
-templates = Jinja2Templates(directory="app/templates")
-
 # Register Tortoise ORM
 register_tortoise(
     app,
-    db_url=settings.database_url,
-    modules={"models": ["app.models.user", "app.models.post", "app.models.comment"]},
+    config=get_tortoise_config(settings.database_url),
     generate_schemas=False,  # Use Alembic for migrations
     add_exception_handlers=True,
 )
@@ -135,6 +131,44 @@ register_tortoise(
 # ============================================
 
 
+@lru_cache
+def render_error_page(template_name: str) -> bytes:
+    """
+    Render an error page once and cache the encoded HTML.
+
+    Error pages have no per-request content, so they are rendered without a
+    request: static asset URLs are emitted as root-relative paths and the
+    navigation shows the logged-out state.
+
+    Args:
+        template_name: Error page template name
+
+    Returns:
+        Rendered page as UTF-8 bytes
+    """
+    template = templates.get_template(template_name)
+    return template.render(url_for=app.url_path_for).encode()
+
+
+def wants_html(request: Request) -> bool:
+    """
+    Check whether the client accepts an HTML response.
+
+    Reads the raw ASGI header list, so no header mapping is built and the
+    Accept value is not decoded.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        True if the first Accept header mentions text/html
+    """
+    for name, value in request.scope["headers"]:
+        if name == b"accept":
+            return b"text/html" in value
+    return False
+
+
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """
@@ -148,26 +182,20 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
         HTML error page or JSON response depending on request type
     """
     # Check if request is for HTML or API
-    accept = request.headers.get("accept", "")
-
-    if "text/html" in accept:
+    if wants_html(request):
         # Return HTML error page
         if exc.status_code == 404:
-            return templates.TemplateResponse(
-                "404.html", {"request": request}, status_code=404
-            )
+            return HTMLResponse(render_error_page("404.html"), status_code=404)
         elif exc.status_code >= 500:
-            return templates.TemplateResponse(
-                "500.html", {"request": request}, status_code=exc.status_code
-            )
+            return HTMLResponse(render_error_page("500.html"), status_code=exc.status_code)
         else:
             # For other HTTP errors, return JSON
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=exc.status_code, content={"detail": str(exc.detail)}
             )
     else:
         # Return JSON for API requests
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code, content={"detail": str(exc.detail)}
         )
 
@@ -184,7 +212,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     Returns:
         JSON response with validation errors
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={"detail": exc.errors(), "body": exc.body},
     )
@@ -202,20 +230,13 @@ async def general_exception_handler(request: Request, exc: Exception):
     Returns:
         HTML error page or JSON response depending on request type
     """
-    import logging
-
-    logger = logging.getLogger(__name__)
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
 
     # Check if request is for HTML or API
-    accept = request.headers.get("accept", "")
-
-    if "text/html" in accept:
-        return templates.TemplateResponse(
-            "500.html", {"request": request}, status_code=500
-        )
+    if wants_html(request):
+        return HTMLResponse(render_error_page("500.html"), status_code=500)
     else:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"detail": "Internal server error"},
         )
@@ -225,21 +246,27 @@ async def general_exception_handler(request: Request, exc: Exception):
 # ROUTES
 # ============================================
 
-
-@app.get("/")
-async def root():
-    """Root endpoint - health check."""
-    return {
+# Health check bodies never change, so they are encoded once at import
+ROOT_BODY = orjson.dumps(
+    {
         "status": "healthy",
         "message": "Blog Application Platform API",
         "version": "0.1.0",
     }
+)
+HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
+
+@app.get("/")
+async def root():
+    """Root endpoint - health check."""
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
 # Register authentication routes
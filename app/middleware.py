@@ -0,0 +1,58 @@
+"""
+ASGI middleware for the blog application.
+
+Middleware here is written as plain ASGI callables so that it works on the
+raw messages instead of wrapping every response in a Response object.
+"""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+# Security headers added to every HTTP response, encoded once at import
+SECURITY_HEADERS: list[tuple[bytes, bytes]] = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"SAMEORIGIN"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+]
+
+# Add HSTS header in production
+if settings.environment == "production":
+    SECURITY_HEADERS.append(
+        (b"strict-transport-security", b"max-age=31536000; includeSubDomains")
+    )
+
+
+class SecurityHeadersMiddleware:
+    """Append the precomputed security headers to every HTTP response."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Wrap an ASGI application.
+
+        Args:
+            app: Next ASGI application in the chain
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI request.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Build a new list: responses may share their header list
+                message["headers"] = [*message.get("headers", ()), *SECURITY_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
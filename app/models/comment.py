@@ -38,6 +38,8 @@ class Comment(Model):
 
         table = "comments"
         ordering = ["created_at"]  # Oldest first
+        # Mirrors the Alembic migrations
+        indexes = (("post_id", "created_at"), ("author_id",), ("created_at",))
 
     def __str__(self) -> str:
         """String representation."""
@@ -18,6 +18,7 @@ class Post(Model):
         title: Post title (1-200 chars)
         content: Post body content (TEXT field, no max length)
         author_id: Foreign key to User.id
+        comment_count: Number of comments, maintained by the comment service
         created_at: Timestamp of post creation
         updated_at: Timestamp of last modification
         comments: Reverse relation to Comment model
@@ -29,6 +30,7 @@ class Post(Model):
     author = fields.ForeignKeyField(
         "models.User", related_name="posts", on_delete=fields.CASCADE
     )
+    comment_count = fields.IntField(default=0)
     created_at = fields.DatetimeField(auto_now_add=True)
     updated_at = fields.DatetimeField(auto_now=True)
 
@@ -40,6 +42,9 @@ class Post(Model):
 
         table = "posts"
         ordering = ["-created_at"]  # Newest first
+        # Mirrors the Alembic migrations; created_at also serves (created_at, id)
+        # keyset scans since id is the rowid
+        indexes = (("created_at",), ("author_id", "created_at"))
 
     def __str__(self) -> str:
         """String representation."""
@@ -17,15 +17,15 @@ class User(Model):
         id: Primary key, auto-incremented integer
         username: Unique username (3-30 chars, alphanumeric + underscore)
         email: Unique email address
-        password_hash: bcrypt hashed password (never store plaintext)
+        password_hash: argon2id hashed password (never store plaintext)
         created_at: Timestamp of account creation
         posts: Reverse relation to Post model
         comments: Reverse relation to Comment model
     """
 
     id = fields.IntField(pk=True)
-    username = fields.CharField(max_length=30, unique=True, index=True)
-    email = fields.CharField(max_length=255, unique=True, index=True)
+    username = fields.CharField(max_length=30, unique=True)
+    email = fields.CharField(max_length=255, unique=True)
     password_hash = fields.CharField(max_length=255)
     created_at = fields.DatetimeField(auto_now_add=True)
 
@@ -38,6 +38,8 @@ class User(Model):
 
         table = "users"
         ordering = ["-created_at"]
+        # username and email are indexed by their UNIQUE constraints
+        indexes = (("created_at",),)
 
     def __str__(self) -> str:
         """String representation."""
@@ -0,0 +1,26 @@
+"""
+Response helpers for API routes.
+
+Routes that build their response schemas from trusted database rows return
+them through model_response, which serializes with Pydantic's JSON encoder
+and skips response_model validation and jsonable_encoder.
+"""
+
+from fastapi import Response, status
+from pydantic import BaseModel
+
+
+def model_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Serialize a schema instance into a JSON response.
+
+    Args:
+        model: Schema instance
+        status_code: HTTP status code of the response
+
+    Returns:
+        JSON response with the serialized body
+    """
+    return Response(
+        content=model.model_dump_json(), status_code=status_code, media_type="application/json"
+    )
@@ -5,8 +5,10 @@ This module defines endpoints for user registration, login, logout, and
 current user information.
 """
 
+import orjson
 from fastapi import APIRouter, Response, status
 
+from app.config import settings
 from app.dependencies.auth import CurrentUser
 from app.models.user import User
 from app.schemas.user import UserLogin, UserRegister, UserResponse
@@ -14,6 +16,33 @@ from app.services.auth import authenticate_user, create_access_token, register_u
 
 router = APIRouter()
 
+# Logout response body, encoded once at import
+LOGOUT_BODY = orjson.dumps({"message": "Successfully logged out"})
+
+# Set-Cookie header for the access token; only the token value varies per request
+COOKIE_TEMPLATE = "access_token={token}; HttpOnly; Max-Age=86400; Path=/; SameSite=lax"  # 24 hours
+if settings.environment == "production":
+    COOKIE_TEMPLATE += "; Secure"
+
+# Set-Cookie header clearing the access token, encoded once at import
+EXPIRED_COOKIE = (
+    b'access_token=""; expires=Thu, 01 Jan 1970 00:00:00 GMT; HttpOnly; Max-Age=0; '
+    b"Path=/; SameSite=lax"
+)
+if settings.environment == "production":
+    EXPIRED_COOKIE += b"; Secure"
+
+
+def set_token_cookie(response: Response, token: str) -> None:
+    """
+    Attach the access token cookie to a response.
+
+    Args:
+        response: Response to add the Set-Cookie header to
+        token: Encoded JWT access token
+    """
+    response.raw_headers.append((b"set-cookie", COOKIE_TEMPLATE.format(token=token).encode()))
+
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(user_data: UserRegister, response: Response):
@@ -27,16 +56,9 @@ async def register(user_data: UserRegister, response: Response):
 
     # Create JWT token and set cookie
     token = create_access_token(user.id)
-    response.set_cookie(
-        key="access_token",
-        value=token,
-        httponly=True,
-        samesite="lax",
-        secure=False,  # Set to True in production with HTTPS
-        max_age=86400,  # 24 hours
-    )
+    set_token_cookie(response, token)
 
-    return UserResponse.model_validate(user)
+    return user
 
 
 @router.post("/login", response_model=UserResponse)
@@ -51,34 +73,22 @@ async def login(credentials: UserLogin, response: Response):
 
     # Create JWT token and set cookie
     token = create_access_token(user.id)
-    response.set_cookie(
-        key="access_token",
-        value=token,
-        httponly=True,
-        samesite="lax",
-        secure=False,  # Set to True in production with HTTPS
-        max_age=86400,  # 24 hours
-    )
+    set_token_cookie(response, token)
 
-    return UserResponse.model_validate(user)
+    return user
 
 
 @router.post("/logout")
-async def logout(response: Response):
+async def logout():
     """
     Log out from the current session.
 
     Clears the JWT token cookie.
     """
-    response.set_cookie(
-        key="access_token",
-        value="",
-        httponly=True,
-        samesite="lax",
-        secure=False,
-        max_age=0,  # Expire immediately
-    )
-    return {"message": "Successfully logged out"}
+    # A fresh Response per request: middleware may mutate response headers
+    response = Response(content=LOGOUT_BODY, media_type="application/json")
+    response.raw_headers.append((b"set-cookie", EXPIRED_COOKIE))
+    return response
 
 
 @router.get("/me", response_model=UserResponse)
@@ -88,5 +98,5 @@ async def get_me(current_user: User = CurrentUser):
 
     Requires authentication.
     """
-    return UserResponse.model_validate(current_user)
+    return current_user
 
@@ -8,7 +8,13 @@ from fastapi import APIRouter, Depends, status
 
 from app.dependencies.auth import get_current_user
 from app.models.user import User
-from app.schemas.comment import CommentCreate, CommentResponse, CommentUpdate
+from app.responses import model_response
+from app.schemas.comment import (
+    CommentCreate,
+    CommentListResponse,
+    CommentResponse,
+    CommentUpdate,
+)
 from app.services.comment import (
     create_comment,
     delete_comment,
@@ -19,25 +25,41 @@ from app.services.comment import (
 router = APIRouter(prefix="/api", tags=["comments"])
 
 
-@router.get("/posts/{post_id}/comments", response_model=list[CommentResponse])
-async def get_post_comments(post_id: int):
+@router.get(
+    "/posts/{post_id}/comments",
+    response_model=None,
+    responses={200: {"model": CommentListResponse}},
+)
+async def get_post_comments(post_id: int, cursor: str | None = None, page_size: int = 50):
     """
-    Get all comments for a post.
+    Get comments for a post with cursor pagination.
 
     Args:
         post_id: ID of the post
+        cursor: next_cursor from the previous page (default: first page)
+        page_size: Items per page (default: 50, max: 100)
 
     Returns:
-        List of comments
+        Page of comments and the cursor for the next page
     """
-    comments = await get_comments_by_post(post_id)
-    return comments
+    comments, next_cursor = await get_comments_by_post(
+        post_id, cursor=cursor, page_size=page_size
+    )
+
+    return model_response(
+        CommentListResponse.model_construct(
+            items=[CommentResponse.from_model(comment) for comment in comments],
+            page_size=page_size,
+            next_cursor=next_cursor,
+        )
+    )
 
 
 @router.post(
     "/posts/{post_id}/comments",
-    response_model=CommentResponse,
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": CommentResponse}},
 )
 async def create_post_comment(
     post_id: int,
@@ -59,10 +81,16 @@ async def create_post_comment(
         post_id=post_id, content=comment_data.content, author=current_user
     )
 
-    return comment
+    return model_response(
+        CommentResponse.from_model(comment), status_code=status.HTTP_201_CREATED
+    )
 
 
-@router.put("/comments/{comment_id}", response_model=CommentResponse)
+@router.put(
+    "/comments/{comment_id}",
+    response_model=None,
+    responses={200: {"model": CommentResponse}},
+)
 async def update_existing_comment(
     comment_id: int,
     comment_data: CommentUpdate,
@@ -83,7 +111,7 @@ async def update_existing_comment(
         comment_id=comment_id, content=comment_data.content, current_user=current_user
     )
 
-    return comment
+    return model_response(CommentResponse.from_model(comment))
 
 
 @router.delete("/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
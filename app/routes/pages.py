@@ -6,12 +6,11 @@ This module defines routes that render Jinja2 templates for the frontend.
 
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from tortoise.functions import Count
 
 from app.models.post import Post
 from app.models.user import User
-
-templates = Jinja2Templates(directory="app/templates")
+from app.templating import templates
 
 router = APIRouter()
 
@@ -43,7 +42,7 @@ async def create_post_page(request: Request):
 @router.get("/posts/{post_id}", response_class=HTMLResponse)
 async def post_detail_page(request: Request, post_id: int):
     """Render the post detail page."""
-    post = await Post.filter(id=post_id).prefetch_related("author").first()
+    post = await Post.filter(id=post_id).select_related("author").first()
 
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
@@ -54,7 +53,7 @@ async def post_detail_page(request: Request, post_id: int):
 @router.get("/posts/{post_id}/edit", response_class=HTMLResponse)
 async def edit_post_page(request: Request, post_id: int):
     """Render the edit post page."""
-    post = await Post.filter(id=post_id).prefetch_related("author").first()
+    post = await Post.filter(id=post_id).select_related("author").first()
 
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
@@ -65,16 +64,19 @@ async def edit_post_page(request: Request, post_id: int):
 @router.get("/users/{user_id}", response_class=HTMLResponse)
 async def user_profile_page(request: Request, user_id: int):
     """Render the user profile page."""
-    user = await User.filter(id=user_id).first()
+    # Load the user and their post count in a single query
+    user = (
+        await User.filter(id=user_id)
+        .annotate(post_count=Count("posts"))
+        .only("id", "username", "created_at")
+        .first()
+    )
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Get post count
-    post_count = await Post.filter(author_id=user_id).count()
-
     return templates.TemplateResponse(
         "user_profile.html",
-        {"request": request, "user": user, "post_count": post_count}
+        {"request": request, "user": user, "post_count": user.post_count}
     )
 
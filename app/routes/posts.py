@@ -4,13 +4,18 @@ Post-related API endpoints.
 This module provides RESTful API routes for blog post CRUD operations.
 """
 
-from math import ceil
-
 from fastapi import APIRouter, Depends, status
 
 from app.dependencies.auth import get_current_user
 from app.models.user import User
-from app.schemas.post import PostCreate, PostListResponse, PostResponse, PostUpdate
+from app.responses import model_response
+from app.schemas.post import (
+    PostCreate,
+    PostList,
+    PostListResponse,
+    PostResponse,
+    PostUpdate,
+)
 from app.services.post import (
     create_post,
     delete_post,
@@ -22,28 +27,35 @@ from app.services.post import (
 router = APIRouter(prefix="/api/posts", tags=["posts"])
 
 
-@router.get("", response_model=PostListResponse)
-async def get_posts(page: int = 1, page_size: int = 20):
+@router.get("", response_model=None, responses={200: {"model": PostListResponse}})
+async def get_posts(cursor: str | None = None, page_size: int = 20):
     """
-    List blog posts with pagination.
+    List blog posts with cursor pagination.
 
     Args:
-        page: Page number (default: 1)
+        cursor: next_cursor from the previous page (default: first page)
         page_size: Items per page (default: 20, max: 50)
 
     Returns:
-        Paginated list of posts
+        Page of posts and the cursor for the next page
     """
-    posts, total = await list_posts(page=page, page_size=page_size)
-
-    total_pages = ceil(total / page_size) if total > 0 else 0
-
-    return PostListResponse(
-        items=posts, total=total, page=page, page_size=page_size, total_pages=total_pages
+    rows, next_cursor = await list_posts(cursor=cursor, page_size=page_size)
+
+    return model_response(
+        PostListResponse.model_construct(
+            items=[PostList.from_row(row) for row in rows],
+            page_size=page_size,
+            next_cursor=next_cursor,
+        )
     )
 
 
-@router.post("", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    response_model=None,
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": PostResponse}},
+)
 async def create_new_post(
     post_data: PostCreate, current_user: User = Depends(get_current_user)
 ):
@@ -61,10 +73,10 @@ async def create_new_post(
         title=post_data.title, content=post_data.content, author=current_user
     )
 
-    return post
+    return model_response(PostResponse.from_model(post), status_code=status.HTTP_201_CREATED)
 
 
-@router.get("/{post_id}", response_model=PostResponse)
+@router.get("/{post_id}", response_model=None, responses={200: {"model": PostResponse}})
 async def get_post(post_id: int):
     """
     Get a single post by ID.
@@ -76,10 +88,10 @@ async def get_post(post_id: int):
         Post details
     """
     post = await get_post_by_id(post_id)
-    return post
+    return model_response(PostResponse.from_model(post))
 
 
-@router.put("/{post_id}", response_model=PostResponse)
+@router.put("/{post_id}", response_model=None, responses={200: {"model": PostResponse}})
 async def update_existing_post(
     post_id: int,
     post_data: PostUpdate,
@@ -103,7 +115,7 @@ async def update_existing_post(
         current_user=current_user,
     )
 
-    return post
+    return model_response(PostResponse.from_model(post))
 
 
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
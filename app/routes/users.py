@@ -5,6 +5,7 @@ This module provides RESTful API routes for user profile operations.
 """
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from app.services.user import get_user_profile
 
@@ -23,5 +24,7 @@ async def get_user(user_id: int):
         User profile with post count
     """
     profile = await get_user_profile(user_id)
-    return profile
+
+    # orjson serializes the datetime natively; skip jsonable_encoder
+    return ORJSONResponse(content=profile)
 
@@ -5,11 +5,15 @@ This module defines schemas for comment creation, updates, and responses.
 """
 
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.schemas.user import UserPublic
 
+if TYPE_CHECKING:
+    from app.models.comment import Comment
+
 
 class CommentCreate(BaseModel):
     """Schema for comment creation request."""
@@ -26,6 +30,8 @@ class CommentUpdate(BaseModel):
 class CommentResponse(BaseModel):
     """Schema for comment response."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     content: str
     author: UserPublic
@@ -33,8 +39,30 @@ class CommentResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True
-
+    @classmethod
+    def from_model(cls, comment: "Comment") -> "CommentResponse":
+        """
+        Build the schema from a trusted ORM object without validation.
+
+        Args:
+            comment: Comment loaded from the database with author fetched
+
+        Returns:
+            CommentResponse instance
+        """
+        return cls.model_construct(
+            id=comment.id,
+            content=comment.content,
+            author=UserPublic.from_model(comment.author),
+            post_id=comment.post_id,
+            created_at=comment.created_at,
+            updated_at=comment.updated_at,
+        )
+
+
+class CommentListResponse(BaseModel):
+    """Schema for cursor-paginated comment list response."""
+
+    items: list[CommentResponse]
+    page_size: int
+    next_cursor: str | None = None
@@ -5,11 +5,15 @@ This module defines schemas for post creation, updates, and responses.
 """
 
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.schemas.user import UserPublic
 
+if TYPE_CHECKING:
+    from app.models.post import Post
+
 
 class PostCreate(BaseModel):
     """Schema for post creation request."""
@@ -28,6 +32,8 @@ class PostUpdate(BaseModel):
 class PostResponse(BaseModel):
     """Schema for full post response (includes content)."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     title: str
     content: str
@@ -35,32 +41,67 @@ class PostResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        """Pydantic configuration."""
+    @classmethod
+    def from_model(cls, post: "Post") -> "PostResponse":
+        """
+        Build the schema from a trusted ORM object without validation.
+
+        Args:
+            post: Post loaded from the database with author fetched
 
-        from_attributes = True
+        Returns:
+            PostResponse instance
+        """
+        return cls.model_construct(
+            id=post.id,
+            title=post.title,
+            content=post.content,
+            author=UserPublic.from_model(post.author),
+            created_at=post.created_at,
+            updated_at=post.updated_at,
+        )
 
 
 class PostList(BaseModel):
     """Schema for post list item (excludes content for performance)."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     title: str
     author: UserPublic
+    comment_count: int
     created_at: datetime
 
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True
+    @classmethod
+    def from_row(cls, row: dict) -> "PostList":
+        """
+        Build the schema from a trusted listing row without validation.
+
+        Args:
+            row: Row from list_posts with id, title, comment_count, created_at,
+                author_id, author__username and author__created_at keys
+
+        Returns:
+            PostList instance
+        """
+        return cls.model_construct(
+            id=row["id"],
+            title=row["title"],
+            author=UserPublic.model_construct(
+                id=row["author_id"],
+                username=row["author__username"],
+                created_at=row["author__created_at"],
+            ),
+            comment_count=row["comment_count"],
+            created_at=row["created_at"],
+        )
 
 
 class PostListResponse(BaseModel):
-    """Schema for paginated post list response."""
+    """Schema for cursor-paginated post list response."""
 
     items: list[PostList]
-    total: int
-    page: int
     page_size: int
-    total_pages: int
+    next_cursor: str | None = None
 
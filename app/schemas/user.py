@@ -5,9 +5,13 @@ This module defines schemas for user registration, login, and responses.
 """
 
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
+if TYPE_CHECKING:
+    from app.models.user import User
+
 
 class UserRegister(BaseModel):
     """Schema for user registration request."""
@@ -44,3 +48,16 @@ class UserPublic(BaseModel):
     username: str
     created_at: datetime
 
+    @classmethod
+    def from_model(cls, user: "User") -> "UserPublic":
+        """
+        Build the schema from a trusted ORM object without validation.
+
+        Args:
+            user: User loaded from the database
+
+        Returns:
+            UserPublic instance
+        """
+        return cls.model_construct(id=user.id, username=user.username, created_at=user.created_at)
+
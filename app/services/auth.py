@@ -5,19 +5,49 @@ This module provides functions for password hashing, JWT token management,
 user registration, and login logic.
 """
 
-from datetime import UTC, datetime, timedelta
+import asyncio
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import bcrypt
 import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from fastapi import HTTPException, status
+from tortoise.exceptions import IntegrityError
 
+from app.cache import TTLCache
 from app.config import settings
 from app.models.user import User
 
+password_hasher = PasswordHasher(
+    time_cost=settings.argon2_time_cost,
+    memory_cost=settings.argon2_memory_cost,
+    parallelism=settings.argon2_parallelism,
+)
+
+# Access token lifetime; exp is issued as an integer epoch timestamp
+TOKEN_LIFETIME_SECONDS = settings.jwt_expire_minutes * 60
+
+# Successfully decoded JWT payloads, keyed by a digest of the token
+_token_cache = TTLCache(maxsize=10_000, ttl=60)
+
+# Prefixes of legacy bcrypt hashes, still accepted and upgraded on login
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# Password hashing is CPU-bound but releases the GIL, so it runs on a bounded
+# thread pool instead of blocking the event loop. The bound also caps how much
+# argon2 memory concurrent logins can allocate.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash"
+)
+
 
 async def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using argon2id.
 
     Args:
         password: Plain text password
@@ -25,14 +55,13 @@ async def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
-    hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
-    return hashed.decode("utf-8")
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, password_hasher.hash, password)
 
 
 async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
-    Verify a password against its hash.
+    Verify a password against its argon2id or legacy bcrypt hash.
 
     Args:
         plain_password: Plain text password to verify
@@ -41,7 +70,37 @@ async def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _hash_executor, _verify_password, plain_password, hashed_password
+    )
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Blocking implementation of verify_password, run on the hash executor."""
+    if hashed_password.startswith(BCRYPT_PREFIXES):
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+    try:
+        return password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash should be replaced with a fresh argon2id hash.
+
+    Args:
+        hashed_password: Stored password hash
+
+    Returns:
+        True for legacy bcrypt hashes and argon2 hashes with outdated parameters
+    """
+    if hashed_password.startswith(BCRYPT_PREFIXES):
+        return True
+
+    return password_hasher.check_needs_rehash(hashed_password)
 
 
 def create_access_token(user_id: int) -> str:
@@ -54,10 +113,7 @@ def create_access_token(user_id: int) -> str:
     Returns:
         Encoded JWT token string
     """
-    expires_delta = timedelta(minutes=settings.jwt_expire_minutes)
-    expire = datetime.now(UTC) + expires_delta
-
-    payload = {"user_id": user_id, "exp": expire}
+    payload = {"user_id": user_id, "exp": int(time.time()) + TOKEN_LIFETIME_SECONDS}
 
     token = jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
     return token
@@ -67,6 +123,9 @@ def decode_access_token(token: str) -> dict:
     """
     Decode and verify a JWT access token.
 
+    Verified payloads are cached for recently seen tokens, never past their
+    ``exp`` claim; failures are never cached.
+
     Args:
         token: JWT token string
 
@@ -74,11 +133,22 @@ def decode_access_token(token: str) -> dict:
         Decoded token payload
 
     Raises:
-        HTTPException: If token is invalid or expired
+        HTTPException: If token is invalid, expired, or lacks exp/user_id
     """
-    try:
-        payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    now = time.time()
+
+    payload = _token_cache.get(key)
+    if payload is not None and payload["exp"] > now:
         return payload
+
+    try:
+        payload = jwt.decode(
+            token,
+            settings.jwt_secret,
+            algorithms=[settings.jwt_algorithm],
+            options={"require": ["exp", "user_id"]},
+        )
     except jwt.ExpiredSignatureError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired"
@@ -88,6 +158,9 @@ def decode_access_token(token: str) -> dict:
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
         ) from e
 
+    _token_cache.set(key, payload, ttl=payload["exp"] - now)
+    return payload
+
 
 async def register_user(username: str, email: str, password: str) -> User:
     """
@@ -104,23 +177,20 @@ async def register_user(username: str, email: str, password: str) -> User:
     Raises:
         HTTPException: If username or email already exists
     """
-    # Check if username already exists
-    existing_username = await User.filter(username=username).first()
-    if existing_username:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT, detail="Username already exists"
-        )
-
-    # Check if email already exists
-    existing_email = await User.filter(email=email).first()
-    if existing_email:
+    # Hash password and create user; the UNIQUE constraints on username and
+    # email reject duplicates atomically, so no pre-insert lookups are needed
+    password_hash = await hash_password(password)
+    try:
+        user = await User.create(username=username, email=email, password_hash=password_hash)
+    except IntegrityError:
+        # Only on conflict: find out which constraint was violated
+        if await User.exists(username=username):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="Username already exists"
+            ) from None
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail="Email already exists"
-        )
-
-    # Hash password and create user
-    password_hash = await hash_password(password)
-    user = await User.create(username=username, email=email, password_hash=password_hash)
+        ) from None
 
     return user
 
@@ -146,5 +216,10 @@ async def authenticate_user(username: str, password: str) -> User:
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid username or password"
         )
 
+    # Upgrade legacy bcrypt hashes (or outdated parameters) while the password is known
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = await hash_password(password)
+        await user.save(update_fields=["password_hash"])
+
     return user
 
@@ -6,10 +6,13 @@ authorization checks and database queries.
 """
 
 from fastapi import HTTPException, status
+from tortoise.expressions import F, Q, Subquery
+from tortoise.transactions import in_transaction
 
 from app.models.comment import Comment
 from app.models.post import Post
 from app.models.user import User
+from app.services.pagination import decode_cursor, encode_cursor
 
 
 async def create_comment(post_id: int, content: str, author: User) -> Comment:
@@ -22,7 +25,7 @@ async def create_comment(post_id: int, content: str, author: User) -> Comment:
         author: User creating the comment
 
     Returns:
-        Created Comment object with author prefetched
+        Created Comment object with the given author attached
 
     Raises:
         HTTPException: If post not found or validation fails
@@ -33,37 +36,66 @@ async def create_comment(post_id: int, content: str, author: User) -> Comment:
             status_code=status.HTTP_400_BAD_REQUEST, detail="Content cannot be empty"
         )
 
-    # Check if post exists
-    post = await Post.filter(id=post_id).first()
-    if not post:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
+    # Bump the post's denormalized comment count and create the comment
+    # together; the count update matching no row doubles as the existence check
+    async with in_transaction():
+        updated = await Post.filter(id=post_id).update(comment_count=F("comment_count") + 1)
+        if not updated:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
 
-    # Create comment
-    comment = await Comment.create(content=content.strip(), post=post, author=author)
-
-    # Fetch with author for response
-    await comment.fetch_related("author")
+        comment = await Comment.create(content=content.strip(), post_id=post_id, author=author)
 
     return comment
 
 
-async def get_comments_by_post(post_id: int) -> list[Comment]:
+async def get_comments_by_post(
+    post_id: int, cursor: str | None = None, page_size: int = 50
+) -> tuple[list[Comment], str | None]:
     """
-    Get all comments for a post, ordered chronologically (oldest first).
+    Get a page of comments for a post, ordered chronologically (oldest first).
+
+    Pages are bounded and use keyset pagination on (created_at, id), which
+    the (post_id, created_at) index serves directly.
 
     Args:
         post_id: ID of the post
+        cursor: Cursor returned with the previous page, or None for the first page
+        page_size: Number of comments per page (max 100)
 
     Returns:
-        List of Comment objects with authors prefetched
+        Tuple of (list of Comment objects with authors loaded,
+        cursor for the next page or None)
+
+    Raises:
+        HTTPException: If cursor or page_size are invalid
     """
+    # Validate pagination parameters
+    if page_size < 1 or page_size > 100:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Page size must be between 1 and 100",
+        )
+
+    query = Comment.filter(post_id=post_id)
+    if cursor is not None:
+        created_at, comment_id = decode_cursor(cursor)
+        query = query.filter(
+            Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=comment_id)
+        )
+
+    # Fetch one extra row to know whether another page follows; authors are
+    # joined into the same query
     comments = (
-        await Comment.filter(post_id=post_id)
-        .prefetch_related("author")
-        .order_by("created_at")
+        await query.select_related("author")
+        .order_by("created_at", "id")
+        .limit(page_size + 1)
     )
 
-    return comments
+    if len(comments) <= page_size:
+        return comments, None
+
+    comments = comments[:page_size]
+    return comments, encode_cursor(comments[-1].created_at, comments[-1].id)
 
 
 async def update_comment(comment_id: int, content: str, current_user: User) -> Comment:
@@ -76,13 +108,14 @@ async def update_comment(comment_id: int, content: str, current_user: User) -> C
         current_user: User attempting the update
 
     Returns:
-        Updated Comment object with author prefetched
+        Updated Comment object with author attached
 
     Raises:
         HTTPException: If comment not found, user not authorized, or validation fails
     """
-    # Get comment
-    comment = await Comment.filter(id=comment_id).prefetch_related("author").first()
+    # Get comment; its author is only needed once it is known to be the
+    # current user, so it is not fetched
+    comment = await Comment.get_or_none(id=comment_id)
 
     if not comment:
         raise HTTPException(
@@ -102,13 +135,11 @@ async def update_comment(comment_id: int, content: str, current_user: User) -> C
             status_code=status.HTTP_400_BAD_REQUEST, detail="Content cannot be empty"
         )
 
-    # Update comment
+    # Update comment; saving sets updated_at (auto_now) on the instance, and
+    # the author is the current user, so nothing needs re-reading
     comment.content = content.strip()
-    await comment.save()
-
-    # Refresh to get updated_at
-    await comment.refresh_from_db()
-    await comment.fetch_related("author")
+    comment.author = current_user
+    await comment.save(update_fields=["content", "updated_at"])
 
     return comment
 
@@ -124,23 +155,28 @@ async def delete_comment(comment_id: int, current_user: User) -> None:
     Raises:
         HTTPException: If comment not found or user not authorized
     """
-    # Get comment
-    comment = await Comment.filter(id=comment_id).prefetch_related("author").first()
-
-    if not comment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
+    # Delete comment only if owned by the user, decrementing its post's
+    # comment count in the same transaction (the count is updated first,
+    # while the comment row still identifies the post)
+    async with in_transaction():
+        owned = Comment.filter(id=comment_id, author_id=current_user.id)
+        updated = await Post.filter(id__in=Subquery(owned.values("post_id"))).update(
+            comment_count=F("comment_count") - 1
         )
+        if updated:
+            await owned.delete()
+            return
 
-    # Check authorization
-    if not check_comment_author(comment, current_user):
+    # Nothing deleted: tell a missing comment apart from someone else's
+    if not await Comment.exists(id=comment_id):
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the comment author can delete this comment",
+            status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
         )
 
-    # Delete comment
-    await comment.delete()
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Only the comment author can delete this comment",
+    )
 
 
 def check_comment_author(comment: Comment, user: User) -> bool:
@@ -154,5 +190,5 @@ def check_comment_author(comment: Comment, user: User) -> bool:
     Returns:
         True if user is the author, False otherwise
     """
-    return comment.author.id == user.id
+    return comment.author_id == user.id
 
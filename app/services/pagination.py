@@ -0,0 +1,59 @@
+"""
+Keyset pagination helpers.
+
+Listings are ordered by (created_at, id). A cursor encodes that position for
+the last row of a page, so the next page can seek straight past it instead of
+scanning and discarding an OFFSET.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+
+import orjson
+from fastapi import HTTPException, status
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    Encode a listing position as an opaque cursor.
+
+    Args:
+        created_at: created_at of the last row of a page
+        row_id: ID of the last row of a page
+
+    Returns:
+        URL-safe base64 cursor for the next page
+    """
+    raw = orjson.dumps([created_at.isoformat(), row_id])
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor from a previous page
+
+    Returns:
+        Tuple of (created_at, id) of the last row on the previous page
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    invalid = HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = orjson.loads(raw)
+        created_at = datetime.fromisoformat(created_at)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+        raise invalid from None
+
+    # Row IDs must be positive SQLite integers (bool is an int subclass), and
+    # timestamps must be aware to compare with the stored created_at values
+    if type(row_id) is not int or not 0 < row_id < 2**63 or created_at.tzinfo is None:
+        raise invalid
+
+    return created_at, row_id
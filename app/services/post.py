@@ -6,9 +6,11 @@ authorization checks, pagination, and database queries.
 """
 
 from fastapi import HTTPException, status
+from tortoise.expressions import Q
 
 from app.models.post import Post
 from app.models.user import User
+from app.services.pagination import decode_cursor, encode_cursor
 
 
 async def create_post(title: str, content: str, author: User) -> Post:
@@ -67,48 +69,66 @@ async def get_post_by_id(post_id: int) -> Post:
     return post
 
 
-async def list_posts(page: int = 1, page_size: int = 20) -> tuple[list[Post], int]:
+# Columns needed for a post list item; content is never loaded for listings
+POST_LIST_FIELDS = (
+    "id",
+    "title",
+    "comment_count",
+    "created_at",
+    "author_id",
+    "author__username",
+    "author__created_at",
+)
+
+
+async def list_posts(
+    cursor: str | None = None, page_size: int = 20
+) -> tuple[list[dict], str | None]:
     """
-    List posts with pagination, ordered by created_at DESC.
+    List posts with keyset pagination, ordered by created_at DESC.
+
+    Each page continues strictly after the (created_at, id) position encoded
+    in the cursor, so the database walks the created_at index instead of
+    scanning and discarding an offset, and no total count is needed. Rows
+    are fetched as plain dicts with the author joined in the same query.
 
     Args:
-        page: Page number (1-indexed)
+        cursor: Cursor returned with the previous page, or None for the first page
         page_size: Number of posts per page (max 50)
 
     Returns:
-        Tuple of (list of Post objects, total count)
+        Tuple of (list of row dicts with POST_LIST_FIELDS keys, cursor for the
+        next page or None)
 
     Raises:
-        HTTPException: If page or page_size are invalid
+        HTTPException: If cursor or page_size are invalid
     """
     # Validate pagination parameters
-    if page < 1:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Page must be >= 1"
-        )
-
     if page_size < 1 or page_size > 50:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Page size must be between 1 and 50",
         )
 
-    # Calculate offset
-    offset = (page - 1) * page_size
+    query = Post.all()
+    if cursor is not None:
+        created_at, post_id = decode_cursor(cursor)
+        query = query.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=post_id)
+        )
 
-    # Get posts with author prefetched
-    posts = (
-        await Post.all()
-        .prefetch_related("author")
-        .order_by("-created_at")
-        .offset(offset)
-        .limit(page_size)
+    # Fetch one extra row to know whether another page follows
+    rows = (
+        await query.order_by("-created_at", "-id")
+        .limit(page_size + 1)
+        .values(*POST_LIST_FIELDS)
     )
 
-    # Get total count
-    total = await Post.all().count()
+    if len(rows) <= page_size:
+        return rows, None
 
-    return posts, total
+    rows = rows[:page_size]
+    return rows, encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
 
 
 async def update_post(post_id: int, title: str, content: str, current_user: User) -> Post:
@@ -151,14 +171,11 @@ async def update_post(post_id: int, title: str, content: str, current_user: User
             status_code=status.HTTP_400_BAD_REQUEST, detail="Content cannot be empty"
         )
 
-    # Update post
+    # Update post; saving sets updated_at (auto_now) on the instance, and the
+    # author fetched above is still attached, so nothing needs re-reading
     post.title = title.strip()
     post.content = content.strip()
-    await post.save()
-
-    # Refresh to get updated_at
-    await post.refresh_from_db()
-    await post.fetch_related("author")
+    await post.save(update_fields=["title", "content", "updated_at"])
 
     return post
 
@@ -174,21 +191,20 @@ async def delete_post(post_id: int, current_user: User) -> None:
     Raises:
         HTTPException: If post not found or user not authorized
     """
-    # Get post
-    post = await Post.filter(id=post_id).prefetch_related("author").first()
-
-    if not post:
+    # Delete post only if owned by the user, in a single statement
+    # (cascade deletes comments via on_delete=CASCADE)
+    deleted = await Post.filter(id=post_id, author_id=current_user.id).delete()
+    if deleted:
+        return
+
+    # Nothing deleted: tell a missing post apart from someone else's
+    if not await Post.exists(id=post_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
 
-    # Check authorization
-    if not check_post_author(post, current_user):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the post author can delete this post",
-        )
-
-    # Delete post (cascade deletes comments via on_delete=CASCADE)
-    await post.delete()
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Only the post author can delete this post",
+    )
 
 
 def check_post_author(post: Post, user: User) -> bool:
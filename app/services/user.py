@@ -6,6 +6,7 @@ fetching user profiles.
 """
 
 from fastapi import HTTPException, status
+from tortoise.functions import Count
 
 from app.models.user import User
 
@@ -23,18 +24,16 @@ async def get_user_profile(user_id: int) -> dict:
     Raises:
         HTTPException: If user not found
     """
-    user = await User.filter(id=user_id).prefetch_related("posts").first()
-
-    if not user:
+    # Count posts in SQL alongside the user row instead of loading them
+    profile = (
+        await User.filter(id=user_id)
+        .annotate(post_count=Count("posts"))
+        .first()
+        .values("id", "username", "created_at", "post_count")
+    )
+
+    if not profile:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-    # Count posts
-    post_count = await user.posts.all().count()
-
-    return {
-        "id": user.id,
-        "username": user.username,
-        "created_at": user.created_at,
-        "post_count": post_count,
-    }
+    return profile
 
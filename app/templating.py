@@ -0,0 +1,35 @@
+"""
+Shared Jinja2 template configuration.
+
+A single Jinja2Templates instance is used by the page routes and the error
+handlers so that compiled templates are cached once per process.
+"""
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+from app.config import settings
+
+templates = Jinja2Templates(directory="app/templates")
+
+# Only check template files for changes during development
+templates.env.auto_reload = settings.environment == "development"
+# Compiled bytecode is reused across restarts. With no directory, Jinja uses a
+# per-user 0700 temp directory and refuses one owned by anyone else.
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+
+
+def warm_templates() -> int:
+    """
+    Compile every template into the environment's cache.
+
+    Called at startup so the first request to each page (and the error
+    pages) does not pay the template compilation cost.
+
+    Returns:
+        Number of templates loaded
+    """
+    names = templates.env.list_templates(extensions=["html"])
+    for name in names:
+        templates.env.get_template(name)
+    return len(names)
@@ -6,18 +6,58 @@ test client, and fixture factories for creating test data.
 """
 
 import asyncio
-from collections.abc import Generator
+import atexit
+import os
+import shutil
+import tempfile
+from collections import Counter
+from collections.abc import AsyncGenerator, Awaitable, Callable
+
+# Cheapest valid argon2id parameters, so hashing in fixtures and auth tests
+# doesn't dominate the suite. Settings are read when the app is imported, so
+# this must run first; explicitly exported values still win.
+os.environ.setdefault("ARGON2_TIME_COST", "1")
+os.environ.setdefault("ARGON2_MEMORY_COST", "8")
+os.environ.setdefault("ARGON2_PARALLELISM", "1")
+
+# Keep test-run logs out of the working tree; the temporary directory is
+# removed at exit, after the app's log listener has been stopped
+if "LOG_DIR" not in os.environ:
+    os.environ["LOG_DIR"] = tempfile.mkdtemp(prefix="blog_app_logs_")
+    atexit.register(shutil.rmtree, os.environ["LOG_DIR"], ignore_errors=True)
 
 import pytest
 import pytest_asyncio
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from tortoise import Tortoise
+from tortoise.expressions import F
 
+from app.dependencies.auth import _user_cache
 from app.main import app
 from app.models.comment import Comment
 from app.models.post import Post
 from app.models.user import User
-from app.services.auth import hash_password
+from app.services.auth import create_access_token, hash_password
+from app.services.comment import create_comment
+
+# Password hashes reused across tests; the database is rebuilt for every test,
+# but a fixture user's password never changes, so it only needs hashing once
+_password_hashes: dict[str, str] = {}
+
+
+async def hash_fixture_password(password: str) -> str:
+    """
+    Hash a fixture user's password, reusing the hash across the session.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        Hashed password string
+    """
+    if password not in _password_hashes:
+        _password_hashes[password] = await hash_password(password)
+    return _password_hashes[password]
 
 
 @pytest.fixture(scope="session")
@@ -29,6 +69,16 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop, as uvicorn does in production, when available."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
 @pytest_asyncio.fixture(scope="function", autouse=True)
 async def init_db():
     """Initialize database for tests with in-memory SQLite."""
@@ -37,20 +87,24 @@ async def init_db():
         modules={"models": ["app.models.user", "app.models.post", "app.models.comment"]},
     )
     await Tortoise.generate_schemas()
+    # IDs are reused by every fresh database, so cached users must not leak
+    _user_cache.clear()
     yield
     await Tortoise.close_connections()
 
 
-@pytest.fixture
-def client() -> TestClient:
-    """Create a test client for FastAPI application."""
-    return TestClient(app)
+@pytest_asyncio.fixture
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    """Create an async test client for FastAPI application."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
 
 
 @pytest_asyncio.fixture
 async def test_user():
     """Create a test user."""
-    password_hash = await hash_password("testpass123")
+    password_hash = await hash_fixture_password("testpass123")
     user = await User.create(
         username="testuser", email="test@example.com", password_hash=password_hash
     )
@@ -60,7 +114,7 @@ async def test_user():
 @pytest_asyncio.fixture
 async def test_user_2():
     """Create a second test user."""
-    password_hash = await hash_password("testpass456")
+    password_hash = await hash_fixture_password("testpass456")
     user = await User.create(
         username="testuser2", email="test2@example.com", password_hash=password_hash
     )
@@ -74,6 +128,32 @@ async def test_user2(test_user_2):
     return test_user_2
 
 
+@pytest.fixture
+def auth_token(test_user) -> str:
+    """Create an access token for test_user."""
+    return create_access_token(test_user.id)
+
+
+@pytest.fixture
+def auth_token_2(test_user_2) -> str:
+    """Create an access token for test_user_2."""
+    return create_access_token(test_user_2.id)
+
+
+@pytest.fixture
+def auth_client(client: AsyncClient, auth_token: str) -> AsyncClient:
+    """Test client sending test_user's access token cookie on every request."""
+    client.cookies.set("access_token", auth_token)
+    return client
+
+
+@pytest.fixture
+def auth_client_2(client: AsyncClient, auth_token_2: str) -> AsyncClient:
+    """Test client sending test_user_2's access token cookie on every request."""
+    client.cookies.set("access_token", auth_token_2)
+    return client
+
+
 @pytest_asyncio.fixture
 async def test_post(test_user):
     """Create a test post."""
@@ -83,11 +163,32 @@ async def test_post(test_user):
     return post
 
 
+@pytest_asyncio.fixture
+async def test_user_posts(test_user):
+    """Create two posts by test_user."""
+    posts = [Post(title=f"Post {i}", content=f"Content {i}", author=test_user) for i in (1, 2)]
+    await Post.bulk_create(posts)
+    return posts
+
+
 @pytest_asyncio.fixture
 async def test_comment(test_post, test_user_2):
     """Create a test comment."""
-    comment = await Comment.create(
-        content="This is a test comment.", post=test_post, author=test_user_2
+    comment = await create_comment(
+        post_id=test_post.id, content="This is a test comment.", author=test_user_2
     )
     return comment
 
+
+@pytest.fixture
+def seed_comments() -> Callable[[list[Comment]], Awaitable[None]]:
+    """Bulk-insert comments, keeping each post's comment_count in step."""
+
+    async def seed(comments: list[Comment]) -> None:
+        await Comment.bulk_create(comments)
+        # bulk_create bypasses create_comment, so bump the counters here
+        for post_id, count in Counter(comment.post_id for comment in comments).items():
+            await Post.filter(id=post_id).update(comment_count=F("comment_count") + count)
+
+    return seed
+
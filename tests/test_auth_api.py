@@ -4,16 +4,16 @@ Integration tests for authentication API endpoints.
 Tests user registration, login, logout, and current user endpoints.
 """
 
-
-from app.services.auth import create_access_token
+import pytest
 
 
 class TestAuthRegistration:
     """Test user registration endpoint."""
 
-    def test_register_success(self, client):
+    @pytest.mark.asyncio
+    async def test_register_success(self, client):
         """Test successful user registration."""
-        response = client.post(
+        response = await client.post(
             "/api/auth/register",
             json={"username": "newuser", "email": "new@example.com", "password": "password123"},
         )
@@ -28,9 +28,10 @@ class TestAuthRegistration:
         # Check cookie was set
         assert "access_token" in response.cookies
 
-    def test_register_duplicate_username(self, client, test_user):
+    @pytest.mark.asyncio
+    async def test_register_duplicate_username(self, client, test_user):
         """Test registration with duplicate username returns 409."""
-        response = client.post(
+        response = await client.post(
             "/api/auth/register",
             json={
                 "username": test_user.username,
@@ -42,9 +43,10 @@ class TestAuthRegistration:
         assert response.status_code == 409
         assert "Username already exists" in response.json()["detail"]
 
-    def test_register_duplicate_email(self, client, test_user):
+    @pytest.mark.asyncio
+    async def test_register_duplicate_email(self, client, test_user):
         """Test registration with duplicate email returns 409."""
-        response = client.post(
+        response = await client.post(
             "/api/auth/register",
             json={"username": "differentuser", "email": test_user.email, "password": "password123"},
         )
@@ -52,9 +54,10 @@ class TestAuthRegistration:
         assert response.status_code == 409
         assert "Email already exists" in response.json()["detail"]
 
-    def test_register_invalid_data(self, client):
+    @pytest.mark.asyncio
+    async def test_register_invalid_data(self, client):
         """Test registration with invalid data returns 422."""
-        response = client.post(
+        response = await client.post(
             "/api/auth/register", json={"username": "ab", "email": "invalid", "password": "short"}
         )
 
@@ -64,9 +67,10 @@ class TestAuthRegistration:
 class TestAuthLogin:
     """Test user login endpoint."""
 
-    def test_login_success(self, client, test_user):
+    @pytest.mark.asyncio
+    async def test_login_success(self, client, test_user):
         """Test successful user login."""
-        response = client.post(
+        response = await client.post(
             "/api/auth/login", json={"username": "testuser", "password": "testpass123"}
         )
 
@@ -78,18 +82,39 @@ class TestAuthLogin:
         # Check cookie was set
         assert "access_token" in response.cookies
 
-    def test_login_invalid_username(self, client):
+    @pytest.mark.asyncio
+    async def test_login_cookie_attributes(self, client, test_user):
+        """Test login sets a single HTTP-only access token cookie usable by /me."""
+        response = await client.post(
+            "/api/auth/login", json={"username": "testuser", "password": "testpass123"}
+        )
+
+        set_cookie_headers = response.headers.get_list("set-cookie")
+        assert len(set_cookie_headers) == 1
+        assert set_cookie_headers[0].startswith("access_token=")
+        assert "HttpOnly" in set_cookie_headers[0]
+        assert "SameSite=lax" in set_cookie_headers[0]
+        assert "Max-Age=86400" in set_cookie_headers[0]
+
+        # The client keeps the cookie from the login response
+        response = await client.get("/api/auth/me")
+        assert response.status_code == 200
+        assert response.json()["username"] == test_user.username
+
+    @pytest.mark.asyncio
+    async def test_login_invalid_username(self, client):
         """Test login with invalid username returns 401."""
-        response = client.post(
+        response = await client.post(
             "/api/auth/login", json={"username": "nonexistent", "password": "password"}
         )
 
         assert response.status_code == 401
         assert "Invalid username or password" in response.json()["detail"]
 
-    def test_login_invalid_password(self, client, test_user):
+    @pytest.mark.asyncio
+    async def test_login_invalid_password(self, client, test_user):
         """Test login with invalid password returns 401."""
-        response = client.post(
+        response = await client.post(
             "/api/auth/login", json={"username": test_user.username, "password": "wrongpassword"}
         )
 
@@ -100,12 +125,10 @@ class TestAuthLogin:
 class TestAuthLogout:
     """Test user logout endpoint."""
 
-    def test_logout_success(self, client, test_user):
+    @pytest.mark.asyncio
+    async def test_logout_success(self, auth_client):
         """Test successful logout."""
-        # First login
-        token = create_access_token(test_user.id)
-
-        response = client.post("/api/auth/logout", cookies={"access_token": token})
+        response = await auth_client.post("/api/auth/logout")
 
         assert response.status_code == 200
         assert "Successfully logged out" in response.json()["message"]
@@ -117,31 +140,45 @@ class TestAuthLogout:
         assert "access_token" in set_cookie_header
         assert "max-age=0" in set_cookie_header.lower() or "expires" in set_cookie_header.lower()
 
+    @pytest.mark.asyncio
+    async def test_logout_clears_cookie(self, auth_client):
+        """Test logout sends a single header that expires the access token cookie."""
+        response = await auth_client.post("/api/auth/logout")
+
+        set_cookie_headers = response.headers.get_list("set-cookie")
+        assert len(set_cookie_headers) == 1
+        assert set_cookie_headers[0].startswith('access_token=""')
+        assert "Max-Age=0" in set_cookie_headers[0]
+        assert "HttpOnly" in set_cookie_headers[0]
+        assert "access_token" not in response.cookies
+
 
 class TestAuthMe:
     """Test current user endpoint."""
 
-    def test_get_me_success(self, client, test_user):
-        """Test getting current user with valid token."""
-        token = create_access_token(test_user.id)
-
-        response = client.get("/api/auth/me", cookies={"access_token": token})
+    @pytest.mark.asyncio
+    async def test_get_me_success(self, auth_client, test_user):
+        """Test getting current user with valid auth_token."""
+        response = await auth_client.get("/api/auth/me")
 
         assert response.status_code == 200
         data = response.json()
         assert data["username"] == test_user.username
         assert data["email"] == test_user.email
 
-    def test_get_me_without_token(self, client):
+    @pytest.mark.asyncio
+    async def test_get_me_without_token(self, client):
         """Test getting current user without token returns 401."""
-        response = client.get("/api/auth/me")
+        response = await client.get("/api/auth/me")
 
         assert response.status_code == 401
         assert "Not authenticated" in response.json()["detail"]
 
-    def test_get_me_invalid_token(self, client):
+    @pytest.mark.asyncio
+    async def test_get_me_invalid_token(self, client):
         """Test getting current user with invalid token returns 401."""
-        response = client.get("/api/auth/me", cookies={"access_token": "invalid-token"})
+        client.cookies.set("access_token", "invalid-token")
+        response = await client.get("/api/auth/me")
 
         assert response.status_code == 401
 
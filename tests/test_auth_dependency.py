@@ -8,7 +8,8 @@ authenticated users from JWT tokens.
 import pytest
 from fastapi import HTTPException
 
-from app.dependencies.auth import get_current_user
+from app.dependencies.auth import _user_cache, get_current_user
+from app.models.user import User
 from app.services.auth import create_access_token
 
 
@@ -16,14 +17,31 @@ class TestAuthDependency:
     """Test authentication dependency."""
 
     @pytest.mark.asyncio
-    async def test_get_current_user_success(self, test_user):
-        """Test get_current_user with valid token."""
-        token = create_access_token(test_user.id)
-
-        user = await get_current_user(access_token=token)
+    async def test_get_current_user_success(self, test_user, auth_token):
+        """Test get_current_user with valid auth_token."""
+        user = await get_current_user(access_token=auth_token)
 
         assert user.id == test_user.id
         assert user.username == test_user.username
+        assert user.email == test_user.email
+        assert user.created_at == test_user.created_at
+
+    @pytest.mark.asyncio
+    async def test_get_current_user_skips_password_hash(self, test_user, auth_token):
+        """Test get_current_user does not load the password hash."""
+        user = await get_current_user(access_token=auth_token)
+
+        assert not hasattr(user, "password_hash")
+
+    @pytest.mark.asyncio
+    async def test_get_current_user_cached(self, test_user, auth_token):
+        """Test repeat lookups for the same user are served from the cache."""
+        first = await get_current_user(access_token=auth_token)
+        await User.filter(id=test_user.id).delete()
+        second = await get_current_user(access_token=auth_token)
+
+        assert second is first
+        assert _user_cache.get(test_user.id) is first
 
     @pytest.mark.asyncio
     async def test_get_current_user_no_token(self):
@@ -52,4 +70,3 @@ class TestAuthDependency:
 
         assert exc_info.value.status_code == 401
         assert "User not found" in exc_info.value.detail
-
@@ -5,14 +5,25 @@ Tests password hashing, JWT token creation/verification, user registration,
 and user authentication.
 """
 
+import asyncio
+import hashlib
+import threading
+import time
+
+import bcrypt
+import jwt
 import pytest
 from fastapi import HTTPException
 
+from app.config import settings
+from app.models.user import User
+from app.services import auth
 from app.services.auth import (
     authenticate_user,
     create_access_token,
     decode_access_token,
     hash_password,
+    password_needs_rehash,
     register_user,
     verify_password,
 )
@@ -23,11 +34,11 @@ class TestPasswordHashing:
 
     @pytest.mark.asyncio
     async def test_hash_password(self):
-        """Test password hashing produces valid bcrypt hash."""
+        """Test password hashing produces valid argon2id hash."""
         password = "testpass123"
         hashed = await hash_password(password)
 
-        assert hashed.startswith("$2b$")
+        assert hashed.startswith("$argon2id$")
         assert len(hashed) > 50
 
     @pytest.mark.asyncio
@@ -46,6 +57,42 @@ class TestPasswordHashing:
 
         assert await verify_password("wrongpassword", hashed) is False
 
+    @pytest.mark.asyncio
+    async def test_hash_password_off_event_loop(self, monkeypatch):
+        """Test hashing runs on the hash executor, not the event loop thread."""
+        threads = []
+
+        class RecordingHasher:
+            def hash(self, password):
+                threads.append(threading.current_thread().name)
+                return "hashed"
+
+        monkeypatch.setattr(auth, "password_hasher", RecordingHasher())
+
+        assert await hash_password("testpass123") == "hashed"
+        assert threads[0].startswith("password-hash")
+
+    @pytest.mark.asyncio
+    async def test_verify_legacy_bcrypt_password(self):
+        """Test legacy bcrypt hashes are still verified and flagged for rehash."""
+        hashed = bcrypt.hashpw(b"testpass123", bcrypt.gensalt(rounds=4)).decode("utf-8")
+
+        assert await verify_password("testpass123", hashed) is True
+        assert await verify_password("wrongpassword", hashed) is False
+        assert password_needs_rehash(hashed) is True
+
+    @pytest.mark.asyncio
+    async def test_verify_invalid_hash(self):
+        """Test verification against a malformed hash fails cleanly."""
+        assert await verify_password("testpass123", "not-a-hash") is False
+
+    @pytest.mark.asyncio
+    async def test_current_hash_does_not_need_rehash(self):
+        """Test fresh argon2id hashes are not flagged for rehash."""
+        hashed = await hash_password("testpass123")
+
+        assert password_needs_rehash(hashed) is False
+
 
 class TestJWTTokens:
     """Test JWT token creation and verification."""
@@ -68,6 +115,16 @@ class TestJWTTokens:
         assert payload["user_id"] == user_id
         assert "exp" in payload
 
+    def test_access_token_expiry(self):
+        """Test exp is an integer timestamp jwt_expire_minutes in the future."""
+        lifetime = settings.jwt_expire_minutes * 60
+        before = int(time.time())
+
+        payload = decode_access_token(create_access_token(1))
+
+        assert isinstance(payload["exp"], int)
+        assert before + lifetime <= payload["exp"] <= int(time.time()) + lifetime
+
     def test_decode_invalid_token(self):
         """Test decoding invalid token raises exception."""
         with pytest.raises(HTTPException) as exc_info:
@@ -76,6 +133,57 @@ class TestJWTTokens:
         assert exc_info.value.status_code == 401
         assert "Invalid token" in exc_info.value.detail
 
+    @pytest.mark.parametrize("payload", [{"user_id": 1}, {"exp": 4102444800}])
+    def test_decode_token_missing_required_claim(self, payload):
+        """Test tokens without exp or user_id are rejected."""
+        token = jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+
+        with pytest.raises(HTTPException) as exc_info:
+            decode_access_token(token)
+
+        assert exc_info.value.status_code == 401
+
+
+class TestTokenCache:
+    """Test caching of decoded JWT payloads."""
+
+    def setup_method(self):
+        """Start every test with an empty token cache."""
+        auth._token_cache.clear()
+
+    def test_decode_reuses_cached_payload(self):
+        """Test a decoded token is served from the cache on the next call."""
+        token = create_access_token(1)
+
+        first = decode_access_token(token)
+        second = decode_access_token(token)
+
+        assert first["user_id"] == 1
+        assert second is first
+        assert len(auth._token_cache) == 1
+
+    def test_decode_does_not_cache_invalid_token(self):
+        """Test invalid tokens are never cached."""
+        with pytest.raises(HTTPException):
+            decode_access_token("invalid-token")
+
+        assert len(auth._token_cache) == 0
+
+    def test_decode_rejects_cached_payload_past_exp(self):
+        """Test a cached payload is not returned once its exp has passed."""
+        token = jwt.encode(
+            {"user_id": 1, "exp": int(time.time()) - 1},
+            settings.jwt_secret,
+            algorithm=settings.jwt_algorithm,
+        )
+        key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+        auth._token_cache.set(key, {"user_id": 1, "exp": int(time.time()) - 1})
+
+        with pytest.raises(HTTPException) as exc_info:
+            decode_access_token(token)
+
+        assert exc_info.value.detail == "Token has expired"
+
 
 class TestUserRegistration:
     """Test user registration logic."""
@@ -87,7 +195,7 @@ class TestUserRegistration:
 
         assert user.username == "newuser"
         assert user.email == "new@example.com"
-        assert user.password_hash.startswith("$2b$")
+        assert user.password_hash.startswith("$argon2id$")
 
     @pytest.mark.asyncio
     async def test_register_duplicate_username(self, test_user):
@@ -107,6 +215,20 @@ class TestUserRegistration:
         assert exc_info.value.status_code == 409
         assert "Email already exists" in exc_info.value.detail
 
+    @pytest.mark.asyncio
+    async def test_register_concurrent_duplicates(self):
+        """Test concurrent registrations of one username create a single user."""
+        results = await asyncio.gather(
+            register_user("raceuser", "race1@example.com", "password123"),
+            register_user("raceuser", "race2@example.com", "password123"),
+            return_exceptions=True,
+        )
+
+        errors = [result for result in results if isinstance(result, HTTPException)]
+        assert len(errors) == 1
+        assert errors[0].status_code == 409
+        assert await User.filter(username="raceuser").count() == 1
+
 
 class TestUserAuthentication:
     """Test user authentication logic."""
@@ -119,6 +241,20 @@ class TestUserAuthentication:
         assert user.id == test_user.id
         assert user.username == test_user.username
 
+    @pytest.mark.asyncio
+    async def test_authenticate_upgrades_legacy_hash(self):
+        """Test logging in with a legacy bcrypt hash rehashes it as argon2id."""
+        legacy_hash = bcrypt.hashpw(b"legacypass123", bcrypt.gensalt(rounds=4)).decode("utf-8")
+        legacy_user = await User.create(
+            username="legacyuser", email="legacy@example.com", password_hash=legacy_hash
+        )
+
+        await authenticate_user("legacyuser", "legacypass123")
+
+        await legacy_user.refresh_from_db()
+        assert legacy_user.password_hash.startswith("$argon2id$")
+        assert await verify_password("legacypass123", legacy_user.password_hash) is True
+
     @pytest.mark.asyncio
     async def test_authenticate_invalid_username(self):
         """Test authentication with invalid username raises exception."""
@@ -0,0 +1,94 @@
+"""
+Tests for the in-process TTL cache.
+"""
+
+import threading
+import time
+
+from app.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache behaviour."""
+
+    def test_get_set(self):
+        """Test storing and retrieving a value."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.get("missing") is None
+        assert cache.get("missing", "default") == "default"
+
+    def test_entry_expires(self, monkeypatch):
+        """Test entries are dropped once their ttl has elapsed."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        cache.set("short", 1, ttl=5)
+        cache.set("long", 2)
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 10)
+
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+        assert len(cache) == 1
+
+    def test_ttl_capped_at_default(self, monkeypatch):
+        """Test a per-entry ttl cannot exceed the cache default."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        cache.set("key", 1, ttl=3600)
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+
+        assert cache.get("key") is None
+
+    def test_non_positive_ttl_not_stored(self):
+        """Test values with an already elapsed ttl are not stored."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("key", 1, ttl=0)
+
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_pop_and_clear(self):
+        """Test removing single entries and clearing the cache."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_concurrent_access_respects_maxsize(self):
+        """Test concurrent writers and readers never overflow the cache."""
+        cache = TTLCache(maxsize=50, ttl=60)
+
+        def worker(offset):
+            for i in range(1000):
+                cache.set(offset + i, i)
+                cache.get(offset + i - 1)
+
+        threads = [threading.Thread(target=worker, args=(n * 1000,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) == 50
@@ -29,6 +29,9 @@ async def test_create_comment(test_post: Post, test_user: User):
     assert comment.author.id == test_user.id
     assert comment.id is not None
 
+    await test_post.refresh_from_db()
+    assert test_post.comment_count == 1
+
 
 @pytest.mark.asyncio
 async def test_create_comment_empty_content(test_post: Post, test_user: User):
@@ -51,34 +54,75 @@ async def test_create_comment_on_nonexistent_post(test_user: User):
 
 
 @pytest.mark.asyncio
-async def test_get_comments_by_post(test_post: Post, test_user: User, test_user2: User):
+async def test_get_comments_by_post(
+    test_post: Post, test_user: User, test_user2: User, seed_comments
+):
     """Test getting comments for a post."""
     # Create multiple comments
-    await Comment.create(content="First comment", post=test_post, author=test_user)
-    await Comment.create(content="Second comment", post=test_post, author=test_user2)
-    await Comment.create(content="Third comment", post=test_post, author=test_user)
+    await seed_comments(
+        [
+            Comment(content=content, post=test_post, author=author)
+            for content, author in [
+                ("First comment", test_user),
+                ("Second comment", test_user2),
+                ("Third comment", test_user),
+            ]
+        ]
+    )
 
-    comments = await get_comments_by_post(test_post.id)
+    comments, next_cursor = await get_comments_by_post(test_post.id)
 
     assert len(comments) >= 3
+    assert next_cursor is None
     # Check ordering (oldest first)
     assert comments[0].content == "First comment"
     assert comments[1].content == "Second comment"
+    # Authors are loaded with the comments
+    assert comments[0].author.username == test_user.username
+    assert comments[1].author.username == test_user2.username
 
 
 @pytest.mark.asyncio
 async def test_get_comments_by_post_empty(test_post: Post):
     """Test getting comments for a post with no comments."""
-    comments = await get_comments_by_post(test_post.id)
+    comments, next_cursor = await get_comments_by_post(test_post.id)
 
     assert len(comments) == 0
+    assert next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_comments_by_post_pagination(test_post: Post, test_user: User, seed_comments):
+    """Test following cursors returns every comment once, oldest first."""
+    await seed_comments(
+        [Comment(content=f"Comment {i}", post=test_post, author=test_user) for i in range(5)]
+    )
+
+    first_page, cursor = await get_comments_by_post(test_post.id, page_size=3)
+    second_page, last_cursor = await get_comments_by_post(
+        test_post.id, cursor=cursor, page_size=3
+    )
+
+    assert [comment.content for comment in first_page + second_page] == [
+        f"Comment {i}" for i in range(5)
+    ]
+    assert last_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_comments_by_post_invalid_page_size(test_post: Post):
+    """Test page size above the limit is rejected."""
+    with pytest.raises(HTTPException) as exc_info:
+        await get_comments_by_post(test_post.id, page_size=101)
+
+    assert exc_info.value.status_code == 400
 
 
 @pytest.mark.asyncio
 async def test_update_comment_by_author(test_user: User, test_post: Post):
     """Test author can update their comment."""
-    comment = await Comment.create(
-        content="Original content", post=test_post, author=test_user
+    comment = await create_comment(
+        post_id=test_post.id, content="Original content", author=test_user
     )
 
     updated_comment = await update_comment(
@@ -87,6 +131,12 @@ async def test_update_comment_by_author(test_user: User, test_post: Post):
 
     assert updated_comment.id == comment.id
     assert updated_comment.content == "Updated content"
+    assert updated_comment.author.id == test_user.id
+
+    # updated_at on the returned object matches what was written
+    stored = await Comment.get(id=comment.id)
+    assert updated_comment.updated_at == stored.updated_at
+    assert stored.updated_at > comment.updated_at
 
 
 @pytest.mark.asyncio
@@ -94,8 +144,8 @@ async def test_update_comment_by_non_author(
     test_user: User, test_user2: User, test_post: Post
 ):
     """Test non-author cannot update comment."""
-    comment = await Comment.create(
-        content="Original content", post=test_post, author=test_user
+    comment = await create_comment(
+        post_id=test_post.id, content="Original content", author=test_user
     )
 
     with pytest.raises(HTTPException) as exc_info:
@@ -119,14 +169,32 @@ async def test_update_comment_not_found(test_user: User):
 @pytest.mark.asyncio
 async def test_delete_comment_by_author(test_user: User, test_post: Post):
     """Test author can delete their comment."""
-    comment = await Comment.create(content="Test comment", post=test_post, author=test_user)
+    comment = await create_comment(post_id=test_post.id, content="Test comment", author=test_user)
     comment_id = comment.id
 
     await delete_comment(comment_id=comment_id, current_user=test_user)
 
     # Verify comment is deleted
-    deleted_comment = await Comment.filter(id=comment_id).first()
-    assert deleted_comment is None
+    assert not await Comment.exists(id=comment_id)
+
+    await test_post.refresh_from_db()
+    assert test_post.comment_count == 0
+
+
+@pytest.mark.asyncio
+async def test_comment_count_maintained(test_user: User, test_user2: User, test_post: Post):
+    """Test creating and deleting comments keeps the post's comment count."""
+    first = await create_comment(post_id=test_post.id, content="First", author=test_user)
+    await create_comment(post_id=test_post.id, content="Second", author=test_user)
+
+    # A rejected delete leaves the count untouched
+    with pytest.raises(HTTPException):
+        await delete_comment(comment_id=first.id, current_user=test_user2)
+
+    await delete_comment(comment_id=first.id, current_user=test_user)
+
+    await test_post.refresh_from_db()
+    assert test_post.comment_count == 1
 
 
 @pytest.mark.asyncio
@@ -134,7 +202,7 @@ async def test_delete_comment_by_non_author(
     test_user: User, test_user2: User, test_post: Post
 ):
     """Test non-author cannot delete comment."""
-    comment = await Comment.create(content="Test comment", post=test_post, author=test_user)
+    comment = await create_comment(post_id=test_post.id, content="Test comment", author=test_user)
 
     with pytest.raises(HTTPException) as exc_info:
         await delete_comment(comment_id=comment.id, current_user=test_user2)
@@ -155,7 +223,7 @@ async def test_delete_comment_not_found(test_user: User):
 @pytest.mark.asyncio
 async def test_check_comment_author(test_user: User, test_user2: User, test_post: Post):
     """Test check_comment_author helper function."""
-    comment = await Comment.create(content="Test", post=test_post, author=test_user)
+    comment = await create_comment(post_id=test_post.id, content="Test", author=test_user)
 
     assert check_comment_author(comment, test_user) is True
     assert check_comment_author(comment, test_user2) is False
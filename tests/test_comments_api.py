@@ -3,23 +3,22 @@ Integration tests for comments API endpoints.
 """
 
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
 from app.models.comment import Comment
 from app.models.post import Post
 from app.models.user import User
-from app.services.auth import create_access_token
+from app.services.comment import create_comment
 
 
 @pytest.mark.asyncio
-async def test_create_comment_success(client: TestClient, test_post: Post, test_user: User):
+async def test_create_comment_success(
+    auth_client: AsyncClient, test_post: Post, test_user: User
+):
     """Test authenticated user can create comment."""
-    token = create_access_token(test_user.id)
-
-    response = client.post(
+    response = await auth_client.post(
         f"/api/posts/{test_post.id}/comments",
         json={"content": "Great post!"},
-        cookies={"access_token": token},
     )
 
     assert response.status_code == 201
@@ -28,11 +27,14 @@ async def test_create_comment_success(client: TestClient, test_post: Post, test_
     assert data["post_id"] == test_post.id
     assert data["author"]["username"] == test_user.username
 
+    await test_post.refresh_from_db()
+    assert test_post.comment_count == 1
+
 
 @pytest.mark.asyncio
-async def test_create_comment_unauthorized(client: TestClient, test_post: Post):
+async def test_create_comment_unauthorized(client: AsyncClient, test_post: Post):
     """Test unauthenticated user cannot create comment."""
-    response = client.post(
+    response = await client.post(
         f"/api/posts/{test_post.id}/comments", json={"content": "Great post!"}
     )
 
@@ -40,14 +42,11 @@ async def test_create_comment_unauthorized(client: TestClient, test_post: Post):
 
 
 @pytest.mark.asyncio
-async def test_create_comment_on_nonexistent_post(client: TestClient, test_user: User):
+async def test_create_comment_on_nonexistent_post(auth_client: AsyncClient):
     """Test creating comment on non-existent post returns 404."""
-    token = create_access_token(test_user.id)
-
-    response = client.post(
+    response = await auth_client.post(
         "/api/posts/99999/comments",
         json={"content": "Great post!"},
-        cookies={"access_token": token},
     )
 
     assert response.status_code == 404
@@ -56,18 +55,25 @@ async def test_create_comment_on_nonexistent_post(client: TestClient, test_user:
 
 @pytest.mark.asyncio
 async def test_get_post_comments_chronological_order(
-    client: TestClient, test_post: Post, test_user: User, test_user_2: User
+    client: AsyncClient, test_post: Post, test_user: User, test_user_2: User, seed_comments
 ):
     """Test comments are returned in chronological order (oldest first)."""
     # Create comments
-    await Comment.create(content="First comment", post=test_post, author=test_user)
-    await Comment.create(content="Second comment", post=test_post, author=test_user_2)
-    await Comment.create(content="Third comment", post=test_post, author=test_user)
+    await seed_comments(
+        [
+            Comment(content=content, post=test_post, author=author)
+            for content, author in [
+                ("First comment", test_user),
+                ("Second comment", test_user_2),
+                ("Third comment", test_user),
+            ]
+        ]
+    )
 
-    response = client.get(f"/api/posts/{test_post.id}/comments")
+    response = await client.get(f"/api/posts/{test_post.id}/comments")
 
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) >= 3
     # Verify ordering (oldest first)
     assert data[0]["content"] == "First comment"
@@ -76,29 +82,63 @@ async def test_get_post_comments_chronological_order(
 
 
 @pytest.mark.asyncio
-async def test_get_post_comments_empty(client: TestClient, test_post: Post):
+async def test_get_post_comments_pagination(
+    client: AsyncClient, test_post: Post, test_user: User, seed_comments
+):
+    """Test comments can be paged through with next_cursor."""
+    await seed_comments(
+        [Comment(content=f"Comment {i}", post=test_post, author=test_user) for i in range(3)]
+    )
+
+    response = await client.get(f"/api/posts/{test_post.id}/comments?page_size=2")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["content"] for item in data["items"]] == ["Comment 0", "Comment 1"]
+    assert data["page_size"] == 2
+
+    response = await client.get(
+        f"/api/posts/{test_post.id}/comments?page_size=2&cursor={data['next_cursor']}"
+    )
+
+    data = response.json()
+    assert [item["content"] for item in data["items"]] == ["Comment 2"]
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_post_comments_empty(client: AsyncClient, test_post: Post):
     """Test get comments for post with no comments."""
-    response = client.get(f"/api/posts/{test_post.id}/comments")
+    response = await client.get(f"/api/posts/{test_post.id}/comments")
 
     assert response.status_code == 200
     data = response.json()
-    assert len(data) == 0
+    assert len(data["items"]) == 0
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_post_comments_out_of_range_cursor(client: AsyncClient, test_post: Post):
+    """Test a cursor whose id overflows SQLite integers returns 400."""
+    # ["2024-01-01T00:00:00+00:00", 18446744073709551615]
+    cursor = "WyIyMDI0LTAxLTAxVDAwOjAwOjAwKzAwOjAwIiwxODQ0Njc0NDA3MzcwOTU1MTYxNV0"
+
+    response = await client.get(f"/api/posts/{test_post.id}/comments?cursor={cursor}")
+
+    assert response.status_code == 400
 
 
 @pytest.mark.asyncio
 async def test_update_comment_by_author_success(
-    client: TestClient, test_user: User, test_post: Post
+    auth_client: AsyncClient, test_user: User, test_post: Post
 ):
     """Test comment author can update their comment."""
-    comment = await Comment.create(
-        content="Original content", post=test_post, author=test_user
+    comment = await create_comment(
+        post_id=test_post.id, content="Original content", author=test_user
     )
-    token = create_access_token(test_user.id)
-
-    response = client.put(
+    response = await auth_client.put(
         f"/api/comments/{comment.id}",
         json={"content": "Updated content"},
-        cookies={"access_token": token},
     )
 
     assert response.status_code == 200
@@ -109,18 +149,15 @@ async def test_update_comment_by_author_success(
 
 @pytest.mark.asyncio
 async def test_update_comment_by_non_author_forbidden(
-    client: TestClient, test_user: User, test_user_2: User, test_post: Post
+    auth_client_2: AsyncClient, test_user: User, test_user_2: User, test_post: Post
 ):
     """Test non-author cannot update comment."""
-    comment = await Comment.create(
-        content="Original content", post=test_post, author=test_user
+    comment = await create_comment(
+        post_id=test_post.id, content="Original content", author=test_user
     )
-    token = create_access_token(test_user_2.id)
-
-    response = client.put(
+    response = await auth_client_2.put(
         f"/api/comments/{comment.id}",
         json={"content": "Hacked content"},
-        cookies={"access_token": token},
     )
 
     assert response.status_code == 403
@@ -128,13 +165,13 @@ async def test_update_comment_by_non_author_forbidden(
 
 
 @pytest.mark.asyncio
-async def test_update_comment_unauthorized(client: TestClient, test_post: Post):
+async def test_update_comment_unauthorized(client: AsyncClient, test_post: Post):
     """Test unauthenticated user cannot update comment."""
-    comment = await Comment.create(
-        content="Test content", post=test_post, author=test_post.author
+    comment = await create_comment(
+        post_id=test_post.id, content="Test content", author=test_post.author
     )
 
-    response = client.put(
+    response = await client.put(
         f"/api/comments/{comment.id}", json={"content": "Updated content"}
     )
 
@@ -142,12 +179,10 @@ async def test_update_comment_unauthorized(client: TestClient, test_post: Post):
 
 
 @pytest.mark.asyncio
-async def test_update_comment_not_found(client: TestClient, test_user: User):
+async def test_update_comment_not_found(auth_client: AsyncClient, test_user: User):
     """Test updating non-existent comment returns 404."""
-    token = create_access_token(test_user.id)
-
-    response = client.put(
-        "/api/comments/99999", json={"content": "Test"}, cookies={"access_token": token}
+    response = await auth_client.put(
+        "/api/comments/99999", json={"content": "Test"}
     )
 
     assert response.status_code == 404
@@ -155,54 +190,51 @@ async def test_update_comment_not_found(client: TestClient, test_user: User):
 
 @pytest.mark.asyncio
 async def test_delete_comment_by_author_success(
-    client: TestClient, test_user: User, test_post: Post
+    auth_client: AsyncClient, test_user: User, test_post: Post
 ):
     """Test comment author can delete their comment."""
-    comment = await Comment.create(content="Test comment", post=test_post, author=test_user)
-    token = create_access_token(test_user.id)
+    comment = await create_comment(post_id=test_post.id, content="Test comment", author=test_user)
     comment_id = comment.id
 
-    response = client.delete(f"/api/comments/{comment_id}", cookies={"access_token": token})
+    response = await auth_client.delete(f"/api/comments/{comment_id}")
 
     assert response.status_code == 204
 
     # Verify comment is deleted
-    deleted_comment = await Comment.filter(id=comment_id).first()
-    assert deleted_comment is None
+    assert not await Comment.exists(id=comment_id)
+
+    await test_post.refresh_from_db()
+    assert test_post.comment_count == 0
 
 
 @pytest.mark.asyncio
 async def test_delete_comment_by_non_author_forbidden(
-    client: TestClient, test_user: User, test_user_2: User, test_post: Post
+    auth_client_2: AsyncClient, test_user: User, test_user_2: User, test_post: Post
 ):
     """Test non-author cannot delete comment."""
-    comment = await Comment.create(content="Test comment", post=test_post, author=test_user)
-    token = create_access_token(test_user_2.id)
-
-    response = client.delete(f"/api/comments/{comment.id}", cookies={"access_token": token})
+    comment = await create_comment(post_id=test_post.id, content="Test comment", author=test_user)
+    response = await auth_client_2.delete(f"/api/comments/{comment.id}")
 
     assert response.status_code == 403
     assert "author" in response.json()["detail"].lower()
 
 
 @pytest.mark.asyncio
-async def test_delete_comment_unauthorized(client: TestClient, test_post: Post):
+async def test_delete_comment_unauthorized(client: AsyncClient, test_post: Post):
     """Test unauthenticated user cannot delete comment."""
-    comment = await Comment.create(
-        content="Test content", post=test_post, author=test_post.author
+    comment = await create_comment(
+        post_id=test_post.id, content="Test content", author=test_post.author
     )
 
-    response = client.delete(f"/api/comments/{comment.id}")
+    response = await client.delete(f"/api/comments/{comment.id}")
 
     assert response.status_code == 401
 
 
 @pytest.mark.asyncio
-async def test_delete_comment_not_found(client: TestClient, test_user: User):
+async def test_delete_comment_not_found(auth_client: AsyncClient, test_user: User):
     """Test deleting non-existent comment returns 404."""
-    token = create_access_token(test_user.id)
-
-    response = client.delete("/api/comments/99999", cookies={"access_token": token})
+    response = await auth_client.delete("/api/comments/99999")
 
     assert response.status_code == 404
 
@@ -0,0 +1,29 @@
+"""
+Tests for the root and health check endpoints.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_health_check(client: AsyncClient):
+    """Test health check returns a JSON status."""
+    response = await client.get("/health")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"status": "healthy"}
+
+
+@pytest.mark.asyncio
+async def test_root(client: AsyncClient):
+    """Test root endpoint returns API information."""
+    response = await client.get("/")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "status": "healthy",
+        "message": "Blog Application Platform API",
+        "version": "0.1.0",
+    }
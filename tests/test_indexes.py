@@ -0,0 +1,36 @@
+"""
+Tests that hot queries are served by indexes.
+"""
+
+import pytest
+from tortoise import Tortoise
+
+
+async def query_plan(sql: str) -> str:
+    """Return SQLite's query plan for a statement as one string."""
+    _, rows = await Tortoise.get_connection("default").execute_query(
+        f"EXPLAIN QUERY PLAN {sql}"
+    )
+    return " | ".join(row["detail"] for row in rows)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "sql",
+    [
+        # Post listing (keyset page)
+        "SELECT id FROM posts WHERE created_at < '2024-01-01' "
+        "ORDER BY created_at DESC, id DESC LIMIT 21",
+        # Comment listing for a post
+        "SELECT id FROM comments WHERE post_id = 1 ORDER BY created_at, id LIMIT 51",
+        # Login and registration lookups
+        "SELECT id FROM users WHERE username = 'a'",
+        "SELECT id FROM users WHERE email = 'a'",
+    ],
+)
+async def test_hot_queries_use_indexes(sql):
+    """Test hot queries search an index instead of scanning the table."""
+    plan = await query_plan(sql)
+
+    assert "USING INDEX" in plan or "USING COVERING INDEX" in plan, plan
+    assert "USE TEMP B-TREE" not in plan, plan
@@ -0,0 +1,26 @@
+"""
+Tests for ASGI middleware.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_security_headers_added(client: AsyncClient):
+    """Test security headers are present on responses."""
+    response = await client.get("/health")
+
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert response.headers["x-frame-options"] == "SAMEORIGIN"
+    assert response.headers["x-xss-protection"] == "1; mode=block"
+    assert response.headers["referrer-policy"] == "strict-origin-when-cross-origin"
+
+
+@pytest.mark.asyncio
+async def test_security_headers_not_duplicated(client: AsyncClient):
+    """Test repeated requests do not accumulate security headers."""
+    await client.get("/health")
+    response = await client.get("/health")
+
+    assert response.headers.get_list("x-frame-options") == ["SAMEORIGIN"]
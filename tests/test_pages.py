@@ -0,0 +1,116 @@
+"""
+Integration tests for HTML page routes and error pages.
+"""
+
+import pytest
+from fastapi import Request
+from httpx import AsyncClient
+
+from app.main import render_error_page, wants_html
+from app.routes import pages
+from app.templating import templates, warm_templates
+
+
+def test_pages_share_templates():
+    """Test page routes use the shared template environment."""
+    assert pages.templates is templates
+    assert templates.env.bytecode_cache is not None
+
+
+@pytest.mark.asyncio
+async def test_login_page(client: AsyncClient):
+    """Test login page renders."""
+    response = await client.get("/login")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+
+
+@pytest.mark.asyncio
+async def test_html_not_found_page(client: AsyncClient):
+    """Test HTML requests for missing pages get the 404 template."""
+    response = await client.get("/does-not-exist", headers={"accept": "text/html"})
+
+    assert response.status_code == 404
+    assert "Page Not Found" in response.text
+    assert 'href="/static/css/style.css"' in response.text
+    assert response.content == render_error_page("404.html")
+
+
+@pytest.mark.asyncio
+async def test_api_not_found_json(client: AsyncClient):
+    """Test API requests for missing resources get a JSON 404."""
+    response = await client.get("/does-not-exist", headers={"accept": "application/json"})
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Not Found"}
+
+
+@pytest.mark.asyncio
+async def test_user_profile_page(client: AsyncClient, test_user, test_user_posts):
+    """Test user profile page shows the user's post count."""
+    response = await client.get(f"/users/{test_user.id}")
+
+    assert response.status_code == 200
+    assert test_user.username in response.text
+    assert "<strong>2</strong> posts" in response.text
+
+
+@pytest.mark.asyncio
+async def test_user_profile_page_not_found(client: AsyncClient):
+    """Test profile page for a missing user returns 404."""
+    response = await client.get("/users/99999", headers={"accept": "text/html"})
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_post_detail_page(client: AsyncClient, test_post):
+    """Test post detail page renders the post and its author."""
+    response = await client.get(f"/posts/{test_post.id}")
+
+    assert response.status_code == 200
+    assert test_post.title in response.text
+    assert "By testuser" in response.text
+
+
+@pytest.mark.asyncio
+async def test_edit_post_page(client: AsyncClient, test_post):
+    """Test edit post page renders the existing post."""
+    response = await client.get(f"/posts/{test_post.id}/edit")
+
+    assert response.status_code == 200
+    assert test_post.title in response.text
+
+
+def test_warm_templates():
+    """Test warming loads every template into the environment cache."""
+    templates.env.cache.clear()
+
+    count = warm_templates()
+
+    assert count == len(templates.env.list_templates(extensions=["html"]))
+    assert len(templates.env.cache) == count
+
+
+def test_render_error_page_cached():
+    """Test error pages are rendered once and reused."""
+    body = render_error_page("500.html")
+
+    assert render_error_page("500.html") is body
+    assert b"500" in body
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ([(b"accept", b"text/html,application/xhtml+xml")], True),
+        ([(b"accept", b"application/json")], False),
+        ([], False),
+    ],
+)
+def test_wants_html(headers, expected):
+    """Test HTML detection from the raw Accept header."""
+    request = Request({"type": "http", "headers": headers})
+
+    assert wants_html(request) is expected
@@ -0,0 +1,49 @@
+"""
+Tests for keyset pagination cursors.
+"""
+
+import base64
+from datetime import UTC, datetime
+
+import orjson
+import pytest
+from fastapi import HTTPException
+
+from app.services.pagination import decode_cursor, encode_cursor
+
+
+def make_cursor(payload) -> str:
+    """Encode an arbitrary JSON payload the way encode_cursor does."""
+    return base64.urlsafe_b64encode(orjson.dumps(payload)).decode().rstrip("=")
+
+
+def test_cursor_round_trip():
+    """Test a cursor decodes to the position it was encoded from."""
+    created_at = datetime(2024, 1, 1, 12, 30, tzinfo=UTC)
+
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        make_cursor({"created_at": "2024-01-01T00:00:00+00:00", "id": 1}),
+        make_cursor(["not-a-date", 1]),
+        make_cursor(["2024-01-01T00:00:00+00:00", 2**64 - 1]),
+        make_cursor(["2024-01-01T00:00:00+00:00", 2**63]),
+        make_cursor(["2024-01-01T00:00:00+00:00", 0]),
+        make_cursor(["2024-01-01T00:00:00+00:00", -1]),
+        make_cursor(["2024-01-01T00:00:00+00:00", True]),
+        make_cursor(["2024-01-01T00:00:00+00:00", "5"]),
+        make_cursor(["2024-01-01T00:00:00+00:00", 1.5]),
+        make_cursor(["2024-01-01T00:00:00", 1]),
+    ],
+)
+def test_decode_invalid_cursor(cursor):
+    """Test malformed, out-of-range, non-integer and naive-time cursors are rejected."""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == "Invalid cursor"
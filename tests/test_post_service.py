@@ -2,11 +2,15 @@
 Unit tests for post service layer.
 """
 
+from datetime import UTC, datetime
+
 import pytest
 from fastapi import HTTPException
 
+from app.models.comment import Comment
 from app.models.post import Post
 from app.models.user import User
+from app.services.comment import create_comment
 from app.services.post import (
     check_post_author,
     create_post,
@@ -72,35 +76,71 @@ async def test_get_post_by_id_not_found():
 async def test_list_posts(test_user: User):
     """Test listing posts with pagination."""
     # Create multiple posts
-    for i in range(5):
-        await Post.create(
-            title=f"Post {i}", content=f"Content {i}", author=test_user
-        )
+    await Post.bulk_create(
+        [Post(title=f"Post {i}", content=f"Content {i}", author=test_user) for i in range(5)]
+    )
 
-    posts, total = await list_posts(page=1, page_size=3)
+    posts, next_cursor = await list_posts(page_size=3)
 
     assert len(posts) == 3
-    assert total == 5
+    assert next_cursor is not None
     # Check ordering (newest first)
-    assert posts[0].title == "Post 4"
-    assert posts[2].title == "Post 2"
+    assert posts[0]["title"] == "Post 4"
+    assert posts[2]["title"] == "Post 2"
+    assert posts[0]["author__username"] == test_user.username
+    assert "content" not in posts[0]
 
 
 @pytest.mark.asyncio
-async def test_list_posts_pagination():
-    """Test pagination works correctly."""
-    # Assuming some posts exist from previous tests
-    posts, total = await list_posts(page=1, page_size=20)
+async def test_list_posts_pagination(test_user: User):
+    """Test following cursors visits every post exactly once."""
+    await Post.bulk_create(
+        [Post(title=f"Post {i}", content=f"Content {i}", author=test_user) for i in range(5)]
+    )
+
+    first_page, cursor = await list_posts(page_size=3)
+    second_page, last_cursor = await list_posts(cursor=cursor, page_size=3)
+
+    assert [post["title"] for post in first_page + second_page] == [
+        f"Post {i}" for i in range(4, -1, -1)
+    ]
+    assert last_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_list_posts_pagination_same_timestamp(test_user: User):
+    """Test posts sharing a created_at are split across pages by id."""
+    await Post.bulk_create(
+        [Post(title=f"Post {i}", content=f"Content {i}", author=test_user) for i in range(4)]
+    )
+    await Post.all().update(created_at=datetime(2024, 1, 1, tzinfo=UTC))
+
+    first_page, cursor = await list_posts(page_size=2)
+    second_page, last_cursor = await list_posts(cursor=cursor, page_size=2)
 
-    assert len(posts) <= 20
-    assert total >= 0
+    assert [post["title"] for post in first_page + second_page] == [
+        "Post 3",
+        "Post 2",
+        "Post 1",
+        "Post 0",
+    ]
+    assert last_cursor is None
 
 
 @pytest.mark.asyncio
-async def test_list_posts_invalid_page():
-    """Test listing posts with invalid page fails."""
+async def test_list_posts_empty():
+    """Test listing with no posts returns an empty page and no cursor."""
+    posts, next_cursor = await list_posts(page_size=20)
+
+    assert posts == []
+    assert next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_list_posts_invalid_cursor():
+    """Test listing posts with a malformed cursor fails."""
     with pytest.raises(HTTPException) as exc_info:
-        await list_posts(page=0, page_size=20)
+        await list_posts(cursor="not-a-cursor", page_size=20)
 
     assert exc_info.value.status_code == 400
 
@@ -109,7 +149,7 @@ async def test_list_posts_invalid_page():
 async def test_list_posts_invalid_page_size():
     """Test listing posts with invalid page size fails."""
     with pytest.raises(HTTPException) as exc_info:
-        await list_posts(page=1, page_size=100)
+        await list_posts(page_size=100)
 
     assert exc_info.value.status_code == 400
 
@@ -127,6 +167,12 @@ async def test_update_post_by_author(test_user: User, test_post: Post):
     assert updated_post.id == test_post.id
     assert updated_post.title == "Updated Title"
     assert updated_post.content == "Updated content"
+    assert updated_post.author.id == test_user.id
+
+    # updated_at on the returned object matches what was written
+    stored = await Post.get(id=test_post.id)
+    assert updated_post.updated_at == stored.updated_at
+    assert stored.updated_at > test_post.updated_at
 
 
 @pytest.mark.asyncio
@@ -166,8 +212,7 @@ async def test_delete_post_by_author(test_user: User, test_post: Post):
     await delete_post(post_id=post_id, current_user=test_user)
 
     # Verify post is deleted
-    deleted_post = await Post.filter(id=post_id).first()
-    assert deleted_post is None
+    assert not await Post.exists(id=post_id)
 
 
 @pytest.mark.asyncio
@@ -183,6 +228,17 @@ async def test_delete_post_by_non_author(test_user: User, test_user2: User):
 
     assert exc_info.value.status_code == 403
     assert "author" in exc_info.value.detail.lower()
+    assert await Post.exists(id=post.id)
+
+
+@pytest.mark.asyncio
+async def test_delete_post_cascades_comments(test_user: User, test_post: Post):
+    """Test deleting a post removes its comments."""
+    await create_comment(post_id=test_post.id, content="Comment", author=test_user)
+
+    await delete_post(post_id=test_post.id, current_user=test_user)
+
+    assert not await Comment.exists(post_id=test_post.id)
 
 
 @pytest.mark.asyncio
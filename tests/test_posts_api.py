@@ -3,22 +3,18 @@ Integration tests for posts API endpoints.
 """
 
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
 from app.models.post import Post
 from app.models.user import User
-from app.services.auth import create_access_token
 
 
 @pytest.mark.asyncio
-async def test_create_post_success(client: TestClient, test_user: User):
+async def test_create_post_success(auth_client: AsyncClient, test_user: User):
     """Test authenticated user can create post."""
-    token = create_access_token(test_user.id)
-
-    response = client.post(
+    response = await auth_client.post(
         "/api/posts",
         json={"title": "New Post", "content": "This is new post content."},
-        cookies={"access_token": token},
     )
 
     assert response.status_code == 201
@@ -29,9 +25,9 @@ async def test_create_post_success(client: TestClient, test_user: User):
 
 
 @pytest.mark.asyncio
-async def test_create_post_unauthorized(client: TestClient):
+async def test_create_post_unauthorized(client: AsyncClient):
     """Test unauthenticated user cannot create post."""
-    response = client.post(
+    response = await client.post(
         "/api/posts", json={"title": "New Post", "content": "This is new post content."}
     )
 
@@ -39,42 +35,64 @@ async def test_create_post_unauthorized(client: TestClient):
 
 
 @pytest.mark.asyncio
-async def test_get_posts_pagination(client: TestClient, test_user: User):
+async def test_get_posts_pagination(client: AsyncClient, test_user: User):
     """Test get posts with pagination."""
     # Create some posts
-    for i in range(5):
-        await Post.create(
-            title=f"Post {i}", content=f"Content {i}", author=test_user
-        )
+    await Post.bulk_create(
+        [Post(title=f"Post {i}", content=f"Content {i}", author=test_user) for i in range(5)]
+    )
 
-    response = client.get("/api/posts?page=1&page_size=3")
+    response = await client.get("/api/posts?page_size=3")
 
     assert response.status_code == 200
     data = response.json()
     assert len(data["items"]) == 3
-    assert data["total"] == 5
-    assert data["page"] == 1
     assert data["page_size"] == 3
-    assert data["total_pages"] == 2
+    assert data["next_cursor"] is not None
+
+    response = await client.get(f"/api/posts?page_size=3&cursor={data['next_cursor']}")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["title"] for item in data["items"]] == ["Post 1", "Post 0"]
+    assert data["next_cursor"] is None
 
 
 @pytest.mark.asyncio
-async def test_get_posts_default_pagination(client: TestClient):
+async def test_get_posts_default_pagination(client: AsyncClient):
     """Test get posts with default pagination."""
-    response = client.get("/api/posts")
+    response = await client.get("/api/posts")
 
     assert response.status_code == 200
     data = response.json()
     assert "items" in data
-    assert "total" in data
-    assert data["page"] == 1
     assert data["page_size"] == 20
+    assert data["next_cursor"] is None
 
 
 @pytest.mark.asyncio
-async def test_get_post_success(client: TestClient, test_post: Post):
+async def test_get_posts_invalid_cursor(client: AsyncClient):
+    """Test get posts with a malformed cursor returns 400."""
+    response = await client.get("/api/posts?cursor=garbage")
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_posts_out_of_range_cursor(client: AsyncClient):
+    """Test a cursor whose id overflows SQLite integers returns 400."""
+    # ["2024-01-01T00:00:00+00:00", 18446744073709551615]
+    cursor = "WyIyMDI0LTAxLTAxVDAwOjAwOjAwKzAwOjAwIiwxODQ0Njc0NDA3MzcwOTU1MTYxNV0"
+
+    response = await client.get(f"/api/posts?cursor={cursor}")
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_post_success(client: AsyncClient, test_post: Post):
     """Test get single post by ID."""
-    response = client.get(f"/api/posts/{test_post.id}")
+    response = await client.get(f"/api/posts/{test_post.id}")
 
     assert response.status_code == 200
     data = response.json()
@@ -84,9 +102,9 @@ async def test_get_post_success(client: TestClient, test_post: Post):
 
 
 @pytest.mark.asyncio
-async def test_get_post_not_found(client: TestClient):
+async def test_get_post_not_found(client: AsyncClient):
     """Test get non-existent post returns 404."""
-    response = client.get("/api/posts/99999")
+    response = await client.get("/api/posts/99999")
 
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
@@ -94,15 +112,12 @@ async def test_get_post_not_found(client: TestClient):
 
 @pytest.mark.asyncio
 async def test_update_post_by_author_success(
-    client: TestClient, test_user: User, test_post: Post
+    auth_client: AsyncClient, test_user: User, test_post: Post
 ):
     """Test post author can update their post."""
-    token = create_access_token(test_user.id)
-
-    response = client.put(
+    response = await auth_client.put(
         f"/api/posts/{test_post.id}",
         json={"title": "Updated Title", "content": "Updated content."},
-        cookies={"access_token": token},
     )
 
     assert response.status_code == 200
@@ -114,15 +129,12 @@ async def test_update_post_by_author_success(
 
 @pytest.mark.asyncio
 async def test_update_post_by_non_author_forbidden(
-    client: TestClient, test_user_2: User, test_post: Post
+    auth_client_2: AsyncClient, test_user_2: User, test_post: Post
 ):
     """Test non-author cannot update post."""
-    token = create_access_token(test_user_2.id)
-
-    response = client.put(
+    response = await auth_client_2.put(
         f"/api/posts/{test_post.id}",
         json={"title": "Hacked Title", "content": "Hacked content."},
-        cookies={"access_token": token},
     )
 
     assert response.status_code == 403
@@ -130,9 +142,9 @@ async def test_update_post_by_non_author_forbidden(
 
 
 @pytest.mark.asyncio
-async def test_update_post_unauthorized(client: TestClient, test_post: Post):
+async def test_update_post_unauthorized(client: AsyncClient, test_post: Post):
     """Test unauthenticated user cannot update post."""
-    response = client.put(
+    response = await client.put(
         f"/api/posts/{test_post.id}",
         json={"title": "Updated Title", "content": "Updated content."},
     )
@@ -140,40 +152,24 @@ async def test_update_post_unauthorized(client: TestClient, test_post: Post):
     assert response.status_code == 401
 
 
-@pytest.mark.asyncio
-async def test_update_post_not_found(client: TestClient, test_user: User):
-    """Test updating non-existent post returns 404."""
-    token = create_access_token(test_user.id)
-
-    response = client.put(
-        "/api/posts/99999",
-        json={"title": "Test", "content": "Test"},
-        cookies={"access_token": token},
-    )
-
-    assert response.status_code == 404
-
-
 @pytest.mark.asyncio
 async def test_delete_post_by_author_success(
-    client: TestClient, test_user: User, test_post: Post
+    auth_client: AsyncClient, test_user: User, test_post: Post
 ):
     """Test post author can delete their post."""
-    token = create_access_token(test_user.id)
     post_id = test_post.id
 
-    response = client.delete(f"/api/posts/{post_id}", cookies={"access_token": token})
+    response = await auth_client.delete(f"/api/posts/{post_id}")
 
     assert response.status_code == 204
 
     # Verify post is deleted
-    deleted_post = await Post.filter(id=post_id).first()
-    assert deleted_post is None
+    assert not await Post.exists(id=post_id)
 
 
 @pytest.mark.asyncio
 async def test_delete_post_by_non_author_forbidden(
-    client: TestClient, test_user: User, test_user_2: User
+    auth_client_2: AsyncClient, test_user: User, test_user_2: User
 ):
     """Test non-author cannot delete post."""
     # Create a post by test_user
@@ -181,28 +177,28 @@ async def test_delete_post_by_non_author_forbidden(
         title="Test Post", content="Test content.", author=test_user
     )
 
-    token = create_access_token(test_user_2.id)
-
-    response = client.delete(f"/api/posts/{post.id}", cookies={"access_token": token})
+    response = await auth_client_2.delete(f"/api/posts/{post.id}")
 
     assert response.status_code == 403
     assert "author" in response.json()["detail"].lower()
 
 
 @pytest.mark.asyncio
-async def test_delete_post_unauthorized(client: TestClient, test_post: Post):
+async def test_delete_post_unauthorized(client: AsyncClient, test_post: Post):
     """Test unauthenticated user cannot delete post."""
-    response = client.delete(f"/api/posts/{test_post.id}")
+    response = await client.delete(f"/api/posts/{test_post.id}")
 
     assert response.status_code == 401
 
 
 @pytest.mark.asyncio
-async def test_delete_post_not_found(client: TestClient, test_user: User):
-    """Test deleting non-existent post returns 404."""
-    token = create_access_token(test_user.id)
-
-    response = client.delete("/api/posts/99999", cookies={"access_token": token})
+@pytest.mark.parametrize(
+    ("method", "kwargs"),
+    [("PUT", {"json": {"title": "Test", "content": "Test"}}), ("DELETE", {})],
+)
+async def test_modify_post_not_found(auth_client: AsyncClient, method: str, kwargs: dict):
+    """Test updating or deleting a non-existent post returns 404."""
+    response = await auth_client.request(method, "/api/posts/99999", **kwargs)
 
     assert response.status_code == 404
 
@@ -5,16 +5,21 @@ This module tests that Pydantic schemas validate data correctly.
 These are pure validation tests that don't require database access.
 """
 
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
 import pytest
 from pydantic import ValidationError
 
+from app.schemas import comment, post, user
 from app.schemas.comment import CommentCreate, CommentUpdate
-from app.schemas.post import PostCreate, PostUpdate
+from app.schemas.post import PostCreate, PostList, PostResponse, PostUpdate
 from app.schemas.user import UserLogin, UserRegister
 
 
-# Disable database fixture for these tests
-pytestmark = pytest.mark.asyncio(scope="module")
+@pytest.fixture(autouse=True)
+def init_db():
+    """Disable the database fixture; these tests never touch the database."""
 
 
 class TestUserSchemas:
@@ -27,34 +32,34 @@ class TestUserSchemas:
             "email": "test@example.com",
             "password": "password123",
         }
-        schema = UserRegister(**data)
+        schema = UserRegister.model_validate(data)
         assert schema.username == "testuser"
         assert schema.email == "test@example.com"
         assert schema.password == "password123"
 
-    def test_user_register_invalid_username(self):
-        """Test user registration with invalid username."""
-        with pytest.raises(ValidationError):
-            UserRegister(
-                username="ab",  # Too short
-                email="test@example.com",
-                password="password123",
-            )
-
-    def test_user_register_invalid_email(self):
-        """Test user registration with invalid email."""
-        with pytest.raises(ValidationError):
-            UserRegister(username="testuser", email="notanemail", password="password123")
-
-    def test_user_register_short_password(self):
-        """Test user registration with short password."""
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            ("username", "ab"),  # Too short
+            ("email", "notanemail"),
+            ("password", "short"),
+        ],
+    )
+    def test_user_register_invalid(self, field, value):
+        """Test user registration with an invalid username, email, or password."""
+        data = {
+            "username": "testuser",
+            "email": "test@example.com",
+            "password": "password123",
+            field: value,
+        }
         with pytest.raises(ValidationError):
-            UserRegister(username="testuser", email="test@example.com", password="short")
+            UserRegister.model_validate(data)
 
     def test_user_login_valid(self):
         """Test valid user login data."""
         data = {"username": "testuser", "password": "password123"}
-        schema = UserLogin(**data)
+        schema = UserLogin.model_validate(data)
         assert schema.username == "testuser"
         assert schema.password == "password123"
 
@@ -65,27 +70,56 @@ class TestPostSchemas:
     def test_post_create_valid(self):
         """Test valid post creation data."""
         data = {"title": "Test Post", "content": "This is test content."}
-        schema = PostCreate(**data)
+        schema = PostCreate.model_validate(data)
         assert schema.title == "Test Post"
         assert schema.content == "This is test content."
 
-    def test_post_create_empty_title(self):
-        """Test post creation with empty title."""
+    @pytest.mark.parametrize("title", ["", "a" * 201])
+    def test_post_create_invalid_title(self, title):
+        """Test post creation with an empty or overly long title."""
         with pytest.raises(ValidationError):
-            PostCreate(title="", content="Content")
-
-    def test_post_create_long_title(self):
-        """Test post creation with overly long title."""
-        with pytest.raises(ValidationError):
-            PostCreate(title="a" * 201, content="Content")
+            PostCreate.model_validate({"title": title, "content": "Content"})
 
     def test_post_update_valid(self):
         """Test valid post update data."""
         data = {"title": "Updated Title", "content": "Updated content."}
-        schema = PostUpdate(**data)
+        schema = PostUpdate.model_validate(data)
         assert schema.title == "Updated Title"
         assert schema.content == "Updated content."
 
+    def test_post_from_model_matches_validation(self):
+        """Test unvalidated construction serializes like validated construction."""
+        now = datetime.now(UTC)
+        author = SimpleNamespace(id=1, username="testuser", email="a@b.c", created_at=now)
+        post = SimpleNamespace(
+            id=2,
+            title="Title",
+            content="Body",
+            author=author,
+            comment_count=3,
+            created_at=now,
+            updated_at=now,
+        )
+
+        row = {
+            "id": 2,
+            "title": "Title",
+            "comment_count": 3,
+            "created_at": now,
+            "author_id": 1,
+            "author__username": "testuser",
+            "author__created_at": now,
+        }
+
+        assert (
+            PostResponse.from_model(post).model_dump_json()
+            == PostResponse.model_validate(post).model_dump_json()
+        )
+        assert (
+            PostList.from_row(row).model_dump_json()
+            == PostList.model_validate(post).model_dump_json()
+        )
+
 
 class TestCommentSchemas:
     """Test Comment-related schemas."""
@@ -93,22 +127,25 @@ class TestCommentSchemas:
     def test_comment_create_valid(self):
         """Test valid comment creation data."""
         data = {"content": "This is a comment."}
-        schema = CommentCreate(**data)
+        schema = CommentCreate.model_validate(data)
         assert schema.content == "This is a comment."
 
-    def test_comment_create_empty_content(self):
-        """Test comment creation with empty content."""
-        with pytest.raises(ValidationError):
-            CommentCreate(content="")
-
-    def test_comment_create_long_content(self):
-        """Test comment creation with overly long content."""
+    @pytest.mark.parametrize("content", ["", "a" * 1001])
+    def test_comment_create_invalid_content(self, content):
+        """Test comment creation with empty or overly long content."""
         with pytest.raises(ValidationError):
-            CommentCreate(content="a" * 1001)
+            CommentCreate.model_validate({"content": content})
 
     def test_comment_update_valid(self):
         """Test valid comment update data."""
         data = {"content": "Updated comment text."}
-        schema = CommentUpdate(**data)
+        schema = CommentUpdate.model_validate(data)
         assert schema.content == "Updated comment text."
 
+
+def test_schemas_built_at_import():
+    """Test every schema is fully built when its module is imported."""
+    for module in (comment, post, user):
+        for value in vars(module).values():
+            if isinstance(value, type) and value.__module__ == module.__name__:
+                assert value.__pydantic_complete__, value.__name__
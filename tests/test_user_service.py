@@ -11,17 +11,13 @@ from app.services.user import get_user_profile
 
 
 @pytest.mark.asyncio
-async def test_get_user_profile(test_user: User):
+async def test_get_user_profile(test_user: User, test_user_posts: list[Post]):
     """Test getting a user profile."""
-    # Create some posts for the user
-    await Post.create(title="Post 1", content="Content 1", author=test_user)
-    await Post.create(title="Post 2", content="Content 2", author=test_user)
-
     profile = await get_user_profile(test_user.id)
 
     assert profile["id"] == test_user.id
     assert profile["username"] == test_user.username
-    assert profile["post_count"] == 2
+    assert profile["post_count"] == len(test_user_posts)
     assert "created_at" in profile
 
 